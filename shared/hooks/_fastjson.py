@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""Shared JSON helpers for the hooks.
+
+Uses orjson when it is installed (2-5x faster on large transcript lines,
+emits bytes directly) and falls back to the stdlib otherwise. Both loads
+variants raise a ValueError subclass on bad input, so callers catch
+ValueError. dumps always returns bytes.
+"""
+
+try:
+    from orjson import loads, dumps
+except ImportError:
+    import json as _json
+
+    loads = _json.loads
+
+    def dumps(obj):
+        return _json.dumps(obj).encode()
@@ -10,6 +10,14 @@ import sys
 import json
 import re
 
+try:
+    from _fastjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
 MODES = {
     "ultrawork": {
         "keywords": ["ultrawork", "ulw", "ultra work"],
@@ -69,29 +77,39 @@ Take time to reason thoroughly before acting.
     }
 }
 
+# One scan of the prompt instead of a substring test per keyword; the named
+# group that matched identifies the mode.
+KEYWORD_RE = re.compile(
+    "|".join(
+        "(?P<{}>{})".format(mode, "|".join(re.escape(k) for k in cfg["keywords"]))
+        for mode, cfg in MODES.items()
+    ),
+    re.IGNORECASE,
+)
+
+# The hook output per mode is immutable — serialize it once at import so a
+# match just writes precomputed bytes.
+for _cfg in MODES.values():
+    _cfg["_payload"] = json_dumps(
+        {"continue": True, "message": _cfg["instruction"]}
+    ) + b"\n"
+
 
 def main():
     try:
         input_data = sys.stdin.read()
-        data = json.loads(input_data)
+        data = json_loads(input_data)
         prompt = data.get("prompt") or data.get("message") or ""
-    except (json.JSONDecodeError, KeyError):
+    except (ValueError, KeyError):
         sys.exit(0)
 
     if not prompt:
         sys.exit(0)
 
-    prompt_lower = prompt.lower()
-
-    for mode_name, mode_config in MODES.items():
-        for keyword in mode_config["keywords"]:
-            if keyword in prompt_lower:
-                result = {
-                    "continue": True,
-                    "message": mode_config["instruction"]
-                }
-                print(json.dumps(result))
-                sys.exit(0)
+    match = KEYWORD_RE.search(prompt)
+    if match:
+        sys.stdout.buffer.write(MODES[match.lastgroup]["_payload"])
+        sys.exit(0)
 
     # No keywords matched
     sys.exit(0)
@@ -13,65 +13,90 @@ import re
 import os
 from pathlib import Path
 
-
-def parse_frontmatter(content: str) -> dict:
-    """Extract YAML frontmatter from markdown content."""
-    lines = content.split('\n')
-    if not lines or lines[0].strip() != '---':
-        return {}
-
-    frontmatter_lines = []
-    for i, line in enumerate(lines[1:], 1):
-        if line.strip() == '---':
-            break
-        frontmatter_lines.append(line)
-
-    result = {}
-    for line in frontmatter_lines:
-        if ':' in line:
-            key, value = line.split(':', 1)
-            value = value.strip()
-            if value.startswith('"') and value.endswith('"'):
-                value = value[1:-1]
-            elif value.startswith("'") and value.endswith("'"):
-                value = value[1:-1]
-            result[key.strip()] = value
-
-    return result
-
-
-def extract_prompt(content: str) -> str:
-    """Extract prompt text after the closing --- of frontmatter."""
-    lines = content.split('\n')
-    dash_count = 0
-    prompt_start = 0
-
-    for i, line in enumerate(lines):
-        if line.strip() == '---':
-            dash_count += 1
-            if dash_count == 2:
-                prompt_start = i + 1
-                break
-
-    if dash_count < 2:
-        return ""
-
-    return '\n'.join(lines[prompt_start:])
+try:
+    from _fastjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+
+def split_document(content: str) -> tuple:
+    """Split state-file content into (frontmatter dict, prompt text).
+
+    Finds the two --- delimiters with str.find and slices once, instead of
+    splitting the whole file into lines three separate times.
+    """
+    if not content.startswith('---'):
+        return {}, ""
+
+    open_end = content.find('\n')
+    if open_end == -1:
+        return {}, ""
+
+    close = content.find('\n---', open_end)
+    if close == -1:
+        return {}, ""
+
+    fm_block = content[open_end + 1:close]
+    prompt_start = content.find('\n', close + 1)
+    prompt = content[prompt_start + 1:] if prompt_start != -1 else ""
+
+    frontmatter = {}
+    for line in fm_block.splitlines():
+        key, sep, value = line.partition(':')
+        if not sep:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+            value = value[1:-1]
+        frontmatter[key.strip()] = value
+
+    return frontmatter, prompt
+
+
+def iter_lines_reverse(path, chunk_size=65536):
+    """Yield a file's lines last-to-first without loading the whole file.
+
+    Reads fixed-size chunks backward from EOF so finding the final
+    assistant message in a large transcript stays cheap.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b''
+        while pos > 0:
+            read_size = min(chunk_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            buf = f.read(read_size) + buf
+            lines = buf.split(b'\n')
+            buf = lines[0]
+            for line in reversed(lines[1:]):
+                if line:
+                    yield line
+        if buf:
+            yield buf
 
 
 def extract_promise_text(output: str) -> str:
-    """Extract text from <promise> tags."""
-    match = re.search(r'<promise>(.*?)</promise>', output, re.DOTALL)
-    if match:
-        return ' '.join(match.group(1).split())
-    return ""
+    """Extract text from <promise> tags via index search (no regex)."""
+    start = output.find('<promise>')
+    if start == -1:
+        return ""
+    start += len('<promise>')
+    end = output.find('</promise>', start)
+    if end == -1:
+        return ""
+    return ' '.join(output[start:end].split())
 
 
 def main():
     try:
         hook_input = sys.stdin.read()
-        data = json.loads(hook_input) if hook_input.strip() else {}
-    except json.JSONDecodeError:
+        data = json_loads(hook_input) if hook_input.strip() else {}
+    except ValueError:
         sys.exit(0)
 
     state_file = Path(".claude/ralph-loop.local.md")
@@ -84,7 +109,7 @@ def main():
     except Exception:
         sys.exit(0)
 
-    frontmatter = parse_frontmatter(content)
+    frontmatter, prompt_text = split_document(content)
     iteration_str = frontmatter.get('iteration', '')
     max_iterations_str = frontmatter.get('max_iterations', '')
     completion_promise = frontmatter.get('completion_promise', '')
@@ -109,32 +134,38 @@ def main():
 
     transcript_path = data.get('transcript_path', '')
 
-    if not transcript_path or not Path(transcript_path).exists():
+    if not transcript_path:
         print(f"Warning: Ralph loop transcript file not found: {transcript_path}", file=sys.stderr)
         state_file.unlink()
         sys.exit(0)
 
+    # EAFP: let the open fail instead of stat-ing the file first
     try:
-        with open(transcript_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        last_raw = None
+        for raw in iter_lines_reverse(transcript_path):
+            if b'"role":"assistant"' in raw or b'"role": "assistant"' in raw:
+                last_raw = raw
+                break
+    except FileNotFoundError:
+        print(f"Warning: Ralph loop transcript file not found: {transcript_path}", file=sys.stderr)
+        state_file.unlink()
+        sys.exit(0)
     except Exception as e:
         print(f"Warning: Failed to read transcript: {e}", file=sys.stderr)
         state_file.unlink()
         sys.exit(0)
 
-    assistant_lines = [l for l in lines if '"role":"assistant"' in l or '"role": "assistant"' in l]
-
-    if not assistant_lines:
+    if last_raw is None:
         print("Warning: No assistant messages found in transcript", file=sys.stderr)
         state_file.unlink()
         sys.exit(0)
 
     try:
-        last_message = json.loads(assistant_lines[-1])
+        last_message = json_loads(last_raw)
         content_blocks = last_message.get('message', {}).get('content', [])
         text_parts = [b.get('text', '') for b in content_blocks if b.get('type') == 'text']
         last_output = '\n'.join(text_parts)
-    except (json.JSONDecodeError, KeyError) as e:
+    except (ValueError, KeyError) as e:
         print(f"Warning: Failed to parse assistant message: {e}", file=sys.stderr)
         state_file.unlink()
         sys.exit(0)
@@ -152,20 +183,25 @@ def main():
             sys.exit(0)
 
     next_iteration = iteration + 1
-    prompt_text = extract_prompt(content)
 
     if not prompt_text.strip():
         print("Warning: Ralph loop state file corrupted (no prompt text found)", file=sys.stderr)
         state_file.unlink()
         sys.exit(0)
 
-    updated_content = re.sub(
-        r'^iteration:\s*\d+',
-        f'iteration: {next_iteration}',
-        content,
-        count=1,
-        flags=re.MULTILINE
-    )
+    # We know the exact current value, so a plain string replace suffices;
+    # fall back to the regex only for unusual spacing.
+    needle = f'\niteration: {iteration}'
+    if needle in content:
+        updated_content = content.replace(needle, f'\niteration: {next_iteration}', 1)
+    else:
+        updated_content = re.sub(
+            r'^iteration:\s*\d+',
+            f'iteration: {next_iteration}',
+            content,
+            count=1,
+            flags=re.MULTILINE
+        )
 
     try:
         state_file.write_text(updated_content, encoding='utf-8')
@@ -183,7 +219,7 @@ def main():
         "systemMessage": system_msg
     }
 
-    print(json.dumps(result))
+    sys.stdout.buffer.write(json_dumps(result) + b"\n")
     sys.exit(0)
 
 
@@ -6,44 +6,97 @@ Blocks exit when incomplete todos exist in the session.
 Usage: Configure in ~/.claude/settings.json under hooks.Stop
 """
 
+import atexit
 import sys
 import json
 import os
+from datetime import datetime
 from pathlib import Path
 
+try:
+    from _fastjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
 CONFIG_FILE = Path.home() / ".claude" / "hooks" / "todo-enforcer.config.json"
 DEBUG_LOG = Path.home() / ".claude" / "hooks" / "todo-enforcer.log"
 MAX_CONSECUTIVE_BLOCKS = 10
 
+_LOG_BUF = []
+
 
 def log(message, level="INFO"):
-    """Write to debug log."""
+    """Buffer a debug log line; the buffer is flushed once at exit."""
+    _LOG_BUF.append(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] [{level}] {message}\n")
+
+
+def _flush_log():
+    """Write all buffered log lines in a single open/write/close."""
+    if not _LOG_BUF:
+        return
+    if not DEBUG_LOG.parent.exists() and not os.environ.get("TODO_ENFORCER_DEBUG"):
+        return
     try:
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        DEBUG_LOG.parent.mkdir(parents=True, exist_ok=True)
         with open(DEBUG_LOG, "a") as f:
-            f.write(f"[{timestamp}] [{level}] {message}\n")
+            f.writelines(_LOG_BUF)
     except Exception:
         pass
 
 
+atexit.register(_flush_log)
+
+
+def iter_lines_reverse(path, chunk_size=65536):
+    """Yield a file's lines last-to-first without loading the whole file.
+
+    The last TodoWrite call is what matters, so scanning backward from EOF
+    usually means one JSON decode instead of one per transcript line.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b''
+        while pos > 0:
+            read_size = min(chunk_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            buf = f.read(read_size) + buf
+            lines = buf.split(b'\n')
+            buf = lines[0]
+            for line in reversed(lines[1:]):
+                if line:
+                    yield line
+        if buf:
+            yield buf
+
+
 def load_config():
     """Load configuration from file."""
     try:
         if CONFIG_FILE.exists():
-            with open(CONFIG_FILE) as f:
-                return json.load(f)
+            with open(CONFIG_FILE, "rb") as f:
+                return json_loads(f.read())
     except Exception:
         pass
     return {"enabled": True, "block_count": 0}
 
 
+_config_dir_ready = False
+
+
 def save_config(config):
     """Save configuration to file."""
+    global _config_dir_ready
     try:
-        CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f)
+        if not _config_dir_ready:
+            CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _config_dir_ready = True
+        with open(CONFIG_FILE, "wb") as f:
+            f.write(json_dumps(config))
     except Exception:
         pass
 
@@ -59,6 +112,13 @@ def main():
     log("Hook started")
 
     config = load_config()
+    config_dirty = False
+
+    def finish(reason):
+        """Flush any pending config change, then allow exit."""
+        if config_dirty:
+            save_config(config)
+        allow_exit(reason)
 
     # Check if disabled
     if not config.get("enabled", True):
@@ -66,8 +126,8 @@ def main():
 
     try:
         input_data = sys.stdin.read()
-        data = json.loads(input_data)
-    except (json.JSONDecodeError, Exception) as e:
+        data = json_loads(input_data)
+    except (ValueError, Exception) as e:
         allow_exit(f"Failed to parse input: {e}")
 
     session_id = data.get("session_id", "unknown")
@@ -84,40 +144,47 @@ def main():
     if stop_hook_active:
         if config.get("last_block_session") == session_id:
             config["block_count"] = 0
-            save_config(config)
+            config_dirty = True
 
     if not transcript_path:
-        allow_exit("No transcript path")
+        finish("No transcript path")
 
-    if not Path(transcript_path).exists():
-        allow_exit("Transcript not found")
+    # Single stat doubles as existence check and size pre-filter
+    try:
+        st = os.stat(transcript_path)
+    except OSError:
+        finish("Transcript not found")
+    if st.st_size < 32:
+        finish("Transcript too small to contain todos")
 
-    # Parse transcript for TodoWrite calls
+    # Scan the transcript backward for the most recent TodoWrite call
     try:
         todos_json = None
-        with open(transcript_path) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                    contents = entry.get("message", {}).get("content", [])
-                    for content in contents:
-                        if (content.get("type") == "tool_use" and
-                            content.get("name") == "TodoWrite"):
-                            todos_json = content.get("input", {}).get("todos")
-                except json.JSONDecodeError:
-                    continue
+        for raw in iter_lines_reverse(transcript_path):
+            # Cheap substring test before paying for a JSON decode
+            if b'"TodoWrite"' not in raw:
+                continue
+            try:
+                entry = json_loads(raw)
+            except ValueError:
+                continue
+            found = False
+            for content in entry.get("message", {}).get("content", []):
+                if (content.get("type") == "tool_use" and
+                    content.get("name") == "TodoWrite"):
+                    todos_json = content.get("input", {}).get("todos")
+                    found = True
+            if found:
+                break
     except Exception as e:
         config["block_count"] = 0
-        save_config(config)
-        allow_exit(f"Failed to parse transcript: {e}")
+        config_dirty = True
+        finish(f"Failed to parse transcript: {e}")
 
     if not todos_json:
         config["block_count"] = 0
-        save_config(config)
-        allow_exit("No todos found")
+        config_dirty = True
+        finish("No todos found")
 
     # Count incomplete todos
     pending = sum(1 for t in todos_json if t.get("status") == "pending")
@@ -128,8 +195,8 @@ def main():
 
     if incomplete == 0:
         config["block_count"] = 0
-        save_config(config)
-        allow_exit("All todos completed")
+        config_dirty = True
+        finish("All todos completed")
 
     # Track consecutive blocks
     if config.get("last_block_session") == session_id:
@@ -141,8 +208,8 @@ def main():
     if block_count >= MAX_CONSECUTIVE_BLOCKS:
         log(f"Safety valve triggered after {MAX_CONSECUTIVE_BLOCKS} blocks", "WARN")
         config["block_count"] = 0
-        save_config(config)
-        allow_exit("Safety valve triggered")
+        config_dirty = True
+        finish("Safety valve triggered")
 
     config["block_count"] = block_count
     config["last_block_session"] = session_id
@@ -172,7 +239,7 @@ Mark each task as 'completed' using TodoWrite when done."""
         "decision": "block",
         "reason": reason
     }
-    print(json.dumps(result))
+    sys.stdout.buffer.write(json_dumps(result) + b"\n")
     sys.exit(0)
 
 
@@ -0,0 +1,21 @@
+"""orjson-backed JSON serialization with stdlib fallback.
+
+The scan and extraction scripts emit 30KB+ page maps and metadata blobs;
+orjson's C serializer is several times faster than stdlib json, but it is
+never worth a hard dependency — plain json takes over when it is absent.
+"""
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json as _json
+
+    loads = _json.loads
+
+    def dumps_indented(obj):
+        return _json.dumps(obj, indent=2, ensure_ascii=False).encode()
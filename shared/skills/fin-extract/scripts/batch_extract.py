@@ -5,10 +5,12 @@ Scans a directory of PDF reports, auto-identifies financial statement pages
 in each one, extracts tables, and classifies them by statement type.
 
 Usage:
-    python batch_extract.py <pdf_directory> [--output-dir <dir>]
+    python batch_extract.py <pdf_directory> [--output-dir <dir>] [--workers N]
 
     If --output-dir is not given, each PDF's tables land in <pdf_stem>_tables/
-    next to the source PDF.
+    next to the source PDF. PDFs are processed in parallel across --workers
+    processes (default: min(cpu_count, 4)); each PDF's pipeline is fully
+    independent, so no shared state is involved.
 
 Output per PDF:
     <output>/<period>_tables/
@@ -22,15 +24,21 @@ Output per PDF:
         _metadata.json
 """
 
-import csv
+import collections
+import functools
+import hashlib
 import json
+import multiprocessing
 import os
 import re
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
 SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
 
 STATEMENT_PATTERNS = [
     ("income_statement", [
@@ -79,49 +87,109 @@ STATEMENT_PATTERNS = [
 ]
 
 
+def _byte_pattern(pattern_text):
+    """Encode a pattern for matching raw UTF-8 bytes.
+
+    Accented letters inside a character class break under encoding: the
+    multi-byte char turns into a class of its individual bytes. Rewrite
+    the known classes as alternations (both cases, since bytes-mode
+    IGNORECASE only folds ASCII) before encoding.
+    """
+    pattern_text = pattern_text.replace("[oó]", "(?:o|ó|Ó)")
+    pattern_text = pattern_text.replace("[eé]", "(?:e|é|É)")
+    return pattern_text.encode("utf-8")
+
+
+# Bytes twins of STATEMENT_PATTERNS: CSV snippets are classified without
+# ever decoding them, since every pattern is a UTF-8 literal match anyway
+STATEMENT_BYTE_PATTERNS = [
+    (stmt, [re.compile(_byte_pattern(p.pattern), re.IGNORECASE) for p in patterns])
+    for stmt, patterns in STATEMENT_PATTERNS
+]
+
+_pattern_counts = [len(patterns) for _, patterns in STATEMENT_PATTERNS]
+
+
+def _build_scoring(pattern_table):
+    """Scoring order with, per entry, the best score any *later* type
+    could reach — lets score_statements stop as soon as the current best
+    is mathematically unbeatable."""
+    return [
+        (stmt, patterns, max(_pattern_counts[i + 1:], default=0))
+        for i, (stmt, patterns) in enumerate(pattern_table)
+    ]
+
+
+_SCORING = _build_scoring(STATEMENT_PATTERNS)
+_SCORING_BYTES = _build_scoring(STATEMENT_BYTE_PATTERNS)
+
+
+PERIOD_RE = re.compile(r"(\d[Qq]\d{2})")
+_PAGE_RE = re.compile(r"page_(\d+)_")
+_PAGE_TABLE_RE = re.compile(r"(page_\d+_table_\d+)")
+
+
+def score_statements(text, scoring=_SCORING):
+    """Score text (str or bytes, with the matching scoring table) against
+    every statement type.
+
+    Returns (best_type, best_score) or (None, 0).
+    """
+    best_type = None
+    best_score = 0
+
+    for stmt_type, patterns, remaining_max in scoring:
+        score = sum(1 for pattern in patterns if pattern.search(text))
+        if score > best_score:
+            best_score = score
+            best_type = stmt_type
+        if best_score >= remaining_max:
+            break
+
+    return best_type, best_score
+
+
 def derive_period(filename):
     """Extract period label from filename like '3Q25.pdf' → '3Q25'."""
     stem = Path(filename).stem
-    match = re.match(r"(\d[Qq]\d{2})", stem)
+    match = PERIOD_RE.match(stem)
     if match:
         return match.group(1).upper()
     return stem
 
 
-def classify_table(csv_path):
-    """Read a CSV's first 15 rows and classify by statement type.
+def build_text_block(csv_path):
+    """Read a CSV's leading bytes and flatten them into a classification blob.
 
-    Returns (statement_type, confidence) or (None, 0).
+    The classifier only keyword-matches a joined blob, so a raw 4KB read
+    with separators replaced by spaces is equivalent to parsing rows with
+    csv.reader — and skips the quote-handling state machine entirely.
+    The bytes stay undecoded; the byte-compiled patterns match the UTF-8
+    directly.
+
+    Returns None if the file is unreadable or empty.
     """
     try:
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            rows = []
-            for i, row in enumerate(reader):
-                if i >= 15:
-                    break
-                rows.append(row)
+        with open(csv_path, "rb") as f:
+            head = f.read(4096)
     except Exception:
-        return None, 0
+        return None
 
-    if not rows:
-        return None, 0
+    if not head:
+        return None
 
-    text_block = " ".join(
-        " ".join(cell for cell in row if cell.strip())
-        for row in rows
-    )
+    return head.replace(b"\n", b" ").replace(b",", b" ").replace(b'"', b" ")
 
-    best_type = None
-    best_score = 0
 
-    for stmt_type, patterns in STATEMENT_PATTERNS:
-        score = sum(1 for p in patterns if p.search(text_block))
-        if score > best_score:
-            best_score = score
-            best_type = stmt_type
+def classify_table(csv_path):
+    """Classify a single CSV by statement type.
 
-    return best_type, best_score
+    Returns (statement_type, confidence) or (None, 0).
+    """
+    text_block = build_text_block(csv_path)
+    if text_block is None:
+        return None, 0
+    return score_statements(text_block, _SCORING_BYTES)
 
 
 def classify_from_scan(page_info):
@@ -129,75 +197,106 @@ def classify_from_scan(page_info):
     text = " ".join(page_info.get("financial_keywords", []))
     text += " " + page_info.get("preview", "")
 
-    best_type = None
-    best_score = 0
+    return score_statements(text)
 
-    for stmt_type, patterns in STATEMENT_PATTERNS:
-        score = sum(1 for p in patterns if p.search(text))
-        if score > best_score:
-            best_score = score
-            best_type = stmt_type
 
-    return best_type, best_score
+def run_scan(pdf_path, isolate=False):
+    """Scan a PDF — in-process by default, subprocess with --isolate."""
+    if isolate:
+        return _run_scan_subprocess(pdf_path)
+
+    try:
+        import scan_pdf
+        return scan_pdf.scan_pdf(str(pdf_path))
+    except Exception as e:
+        print(f"  ERROR scanning {pdf_path}: {e}", file=sys.stderr)
+        return None
+
+
+def _run_child(argv, timeout):
+    """Run a child interpreter with stdout spooled to a tempfile.
 
+    Keeps parent RSS bounded no matter how much the child writes: stdout
+    goes straight to disk instead of an in-memory pipe buffer, and only
+    the parsed JSON result is held afterwards.
 
-def run_scan(pdf_path):
-    """Run scan_pdf.py and return parsed JSON."""
-    result = subprocess.run(
+    Returns (returncode, parsed_json_or_None, stderr_text).
+    """
+    with tempfile.TemporaryFile() as tf:
+        proc = subprocess.Popen(argv, stdout=tf, stderr=subprocess.PIPE)
+        try:
+            _, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        tf.seek(0)
+        try:
+            parsed = json.load(tf)
+        except ValueError:
+            parsed = None
+    return proc.returncode, parsed, stderr.decode("utf-8", errors="replace")
+
+
+def _run_scan_subprocess(pdf_path):
+    """Run scan_pdf.py in a child interpreter (crash isolation)."""
+    returncode, parsed, stderr = _run_child(
         [sys.executable, str(SCRIPTS_DIR / "scan_pdf.py"), str(pdf_path)],
-        capture_output=True, timeout=300, encoding="utf-8", errors="replace",
+        timeout=300,
     )
-    if result.returncode != 0:
-        print(f"  ERROR scanning {pdf_path}: {result.stderr}", file=sys.stderr)
+    if returncode != 0:
+        print(f"  ERROR scanning {pdf_path}: {stderr}", file=sys.stderr)
         return None
 
-    stdout = result.stdout or ""
-    try:
-        return json.loads(stdout)
-    except (json.JSONDecodeError, TypeError):
+    if parsed is None:
         print(f"  ERROR parsing scan output for {pdf_path}", file=sys.stderr)
-        return None
+    return parsed
 
 
-def select_financial_pages(scan_data, max_pages=15):
-    """Pick the best pages for extraction from scan results.
+def select_financial_pages(scan_pages, max_pages=15):
+    """Pick the best pages for extraction from scanned page metadata.
 
     Only selects pages that have BOTH tables AND multiple financial keywords.
     Caps at max_pages to avoid extracting chart/property pages.
     """
-    pages = scan_data.get("pages", [])
     scored = []
 
-    for p in pages:
+    for p in scan_pages:
         kw_count = len(p.get("financial_keywords", []))
         table_count = p.get("tables", 0)
 
-        if table_count > 0 and kw_count >= 2:
-            score = kw_count * 2 + table_count
-            scored.append((p["page"], score, p))
+        if table_count > 0 and kw_count >= 1:
+            # Tier first so pages with 2+ keywords always outrank the
+            # single-keyword fallback tier, then score within the tier
+            tier = 1 if kw_count >= 2 else 0
+            scored.append((p["page"], (tier, kw_count * 2 + table_count)))
 
-    scored.sort(key=lambda x: -x[1])
+    scored.sort(key=lambda x: x[1], reverse=True)
 
-    # Take top pages by score, capped at max_pages
-    selected = [s[0] for s in scored[:max_pages]]
+    # If any strict-tier page exists, don't mix in fallback pages
+    if scored and scored[0][1][0] == 1:
+        scored = [s for s in scored if s[1][0] == 1]
 
-    if not selected:
-        # Relax: accept pages with at least 1 keyword + tables
-        fallback = [
-            (p["page"], len(p.get("financial_keywords", [])))
-            for p in pages
-            if p.get("tables", 0) > 0 and len(p.get("financial_keywords", [])) >= 1
-        ]
-        fallback.sort(key=lambda x: -x[1])
-        selected = [s[0] for s in fallback[:max_pages]]
+    return [s[0] for s in scored[:max_pages]]
 
-    return selected
 
+def run_extraction(pdf_path, output_dir, page_numbers, isolate=False):
+    """Extract tables — in-process by default, subprocess with --isolate."""
+    if isolate:
+        return _run_extraction_subprocess(pdf_path, output_dir, page_numbers)
 
-def run_extraction(pdf_path, output_dir, page_numbers):
-    """Run extract_tables.py on given pages."""
+    try:
+        import extract_tables
+        return extract_tables.extract(str(pdf_path), output_dir, list(page_numbers))
+    except Exception as e:
+        print(f"  ERROR extracting {pdf_path}: {e}", file=sys.stderr)
+        return None
+
+
+def _run_extraction_subprocess(pdf_path, output_dir, page_numbers):
+    """Run extract_tables.py in a child interpreter (crash isolation)."""
     page_spec = ",".join(str(p) for p in page_numbers)
-    result = subprocess.run(
+    returncode, parsed, stderr = _run_child(
         [
             sys.executable,
             str(SCRIPTS_DIR / "extract_tables.py"),
@@ -205,64 +304,57 @@ def run_extraction(pdf_path, output_dir, page_numbers):
             str(output_dir),
             page_spec,
         ],
-        capture_output=True, timeout=600, encoding="utf-8", errors="replace",
+        timeout=600,
     )
-    if result.returncode != 0:
-        print(f"  ERROR extracting {pdf_path}: {result.stderr}", file=sys.stderr)
+    if returncode != 0:
+        print(f"  ERROR extracting {pdf_path}: {stderr}", file=sys.stderr)
         return None
 
-    stdout = result.stdout or ""
-    try:
-        return json.loads(stdout)
-    except (json.JSONDecodeError, TypeError, ValueError):
+    if parsed is None:
         print(f"  WARNING: no JSON output from extraction of {pdf_path}", file=sys.stderr)
-        return None
+    return parsed
 
 
-def rename_tables(output_dir, period, scan_data):
+def rename_tables(output_dir, period, page_lookup):
     """Classify and rename extracted CSVs from page_N_table_M.csv to statement_type_period.csv.
 
-    Returns a dict mapping statement_type → csv_path.
+    page_lookup maps page number → scan info; it is only consulted when
+    content classification fails. Returns a dict mapping statement_type → csv_path.
     """
     csv_files = sorted(output_dir.glob("page_*_table_*.csv"))
     if not csv_files:
         return {}
 
-    # Build page→scan_info lookup
-    page_lookup = {}
-    if scan_data:
-        for p in scan_data.get("pages", []):
-            page_lookup[p["page"]] = p
-
     classified = {}
-    used_names = set()
-
-    def safe_rename(src, dst):
-        """Rename that works on Windows (overwrites if exists)."""
-        if dst.exists():
-            dst.unlink()
-        src.rename(dst)
+    # Per-base counters make the next collision-free suffix an O(1)
+    # lookup instead of probing a set of used names
+    name_counts = collections.Counter()
 
     def unique_name(base, period):
         """Generate a unique filename, appending _2, _3, etc. if needed."""
-        name = f"{base}_{period}.csv"
-        if name not in used_names:
-            used_names.add(name)
-            return name, base
-        counter = 2
-        while True:
-            name = f"{base}_{counter}_{period}.csv"
-            key = f"{base}_{counter}"
-            if name not in used_names:
-                used_names.add(name)
-                return name, key
-            counter += 1
+        idx = name_counts[base]
+        name_counts[base] += 1
+        if idx == 0:
+            return f"{base}_{period}.csv", base
+        return f"{base}_{idx + 1}_{period}.csv", f"{base}_{idx + 1}"
+
+    # Batch-classify: read every snippet once, then sweep each statement
+    # pattern across the whole batch instead of per-file
+    snippets = [(p, build_text_block(p)) for p in csv_files]
+    scores = {p: (None, 0) for p, _ in snippets}
+    for candidate_type, patterns in STATEMENT_BYTE_PATTERNS:
+        for p, text in snippets:
+            if not text:
+                continue
+            s = sum(1 for pattern in patterns if pattern.search(text))
+            if s > scores[p][1]:
+                scores[p] = (candidate_type, s)
 
     for csv_path in csv_files:
-        stmt_type, score = classify_table(csv_path)
+        stmt_type, score = scores[csv_path]
 
         if score < 1:
-            match = re.match(r"page_(\d+)_", csv_path.name)
+            match = _PAGE_RE.match(csv_path.name)
             if match:
                 page_num = int(match.group(1))
                 page_info = page_lookup.get(page_num, {})
@@ -274,21 +366,70 @@ def rename_tables(output_dir, period, scan_data):
         if stmt_type:
             new_name, key = unique_name(stmt_type, period)
         else:
-            match = re.match(r"(page_\d+_table_\d+)", csv_path.name)
+            match = _PAGE_TABLE_RE.match(csv_path.name)
             base = match.group(1) if match else csv_path.stem
             new_name, key = unique_name(base, period)
 
         new_path = output_dir / new_name
-        safe_rename(csv_path, new_path)
+        # Atomic overwrite on both POSIX and Windows
+        os.replace(csv_path, new_path)
         classified[key] = new_path
 
     return classified
 
 
-def process_pdf(pdf_path, output_base=None):
-    """Full pipeline for a single PDF: scan → select pages → extract → classify."""
+CACHE_FILE = "_batch_result.json"
+
+
+def hash_pdf(pdf_path):
+    """Content hash of a PDF, streamed in 1MB chunks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(pdf_path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_cached_result(output_dir, source_hash):
+    """Return the cached process_pdf result if it matches source_hash, else None."""
+    try:
+        with open(output_dir / CACHE_FILE, "rb") as f:
+            cached = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if cached.get("source_hash") != source_hash:
+        return None
+    result = cached.get("result")
+    if not isinstance(result, dict) or result.get("status") != "ok":
+        return None
+    return result
+
+
+def save_cached_result(output_dir, source_hash, result):
+    """Record the result keyed on the source PDF's content hash."""
+    try:
+        with open(output_dir / CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"source_hash": source_hash, "result": result}, f)
+    except OSError:
+        pass
+
+
+def process_pdf(pdf_path, output_base=None, isolate=False, force=False):
+    """Full pipeline for a single PDF: scan → select pages → extract → classify.
+
+    Progress messages are buffered and written to stderr in one call at
+    the end, so parallel workers don't interleave their output line by
+    line (and each PDF costs one write syscall instead of eight).
+    """
     period = derive_period(pdf_path.name)
 
+    log_lines = []
+    log = log_lines.append
+
+    def finish(result):
+        sys.stderr.write("\n".join(log_lines) + "\n")
+        return result
+
     if output_base:
         output_dir = Path(output_base) / f"{period}_tables"
     else:
@@ -296,42 +437,61 @@ def process_pdf(pdf_path, output_base=None):
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"\n{'='*60}", file=sys.stderr)
-    print(f"Processing: {pdf_path.name} (period: {period})", file=sys.stderr)
-    print(f"{'='*60}", file=sys.stderr)
+    log(f"\n{'='*60}")
+    log(f"Processing: {pdf_path.name} (period: {period})")
+    log(f"{'='*60}")
+
+    # Hashing the PDF costs milliseconds; a full scan+extract costs many
+    # seconds, so reruns over an unchanged corpus become near-free
+    source_hash = hash_pdf(pdf_path)
+    if not force:
+        cached = load_cached_result(output_dir, source_hash)
+        if cached is not None:
+            log(f"  Unchanged since last run, using cached result")
+            return finish(cached)
 
     # Phase 1: Scan
-    print(f"  Scanning...", file=sys.stderr)
-    scan_data = run_scan(pdf_path)
+    log(f"  Scanning...")
+    scan_data = run_scan(pdf_path, isolate=isolate)
     if not scan_data:
-        return {"period": period, "status": "scan_failed", "tables": {}}
+        return finish({"period": period, "status": "scan_failed", "tables": {}})
+
+    # Build the page index once; both page selection and classification
+    # fallback read from it, so the pages list is walked a single time
+    scan_pages = scan_data.get("pages", [])
+    page_lookup = {p["page"]: p for p in scan_pages}
 
     # Phase 2: Select pages
-    pages = select_financial_pages(scan_data)
+    pages = select_financial_pages(scan_pages)
     if not pages:
-        print(f"  No financial pages found in {pdf_path.name}", file=sys.stderr)
-        return {"period": period, "status": "no_financial_pages", "tables": {}}
+        log(f"  No financial pages found in {pdf_path.name}")
+        return finish({"period": period, "status": "no_financial_pages", "tables": {}})
 
-    print(f"  Selected {len(pages)} pages: {pages}", file=sys.stderr)
+    log(f"  Selected {len(pages)} pages: {pages}")
 
     # Phase 3: Extract
-    print(f"  Extracting tables...", file=sys.stderr)
-    meta = run_extraction(pdf_path, output_dir, pages)
+    log(f"  Extracting tables...")
+    meta = run_extraction(pdf_path, output_dir, pages, isolate=isolate)
 
     # Phase 4: Classify and rename
-    print(f"  Classifying tables...", file=sys.stderr)
-    classified = rename_tables(output_dir, period, scan_data)
+    log(f"  Classifying tables...")
+    classified = rename_tables(output_dir, period, page_lookup)
 
     table_summary = {k: str(v) for k, v in classified.items()}
-    print(f"  Found: {', '.join(table_summary.keys()) or 'none'}", file=sys.stderr)
+    log(f"  Found: {', '.join(table_summary.keys()) or 'none'}")
 
-    return {
+    result = {
         "period": period,
         "status": "ok",
         "pages_extracted": pages,
         "tables": table_summary,
         "extraction_metadata": meta,
     }
+    # Only cache complete runs: a failed extraction (meta is None) must be
+    # retried next time, not served back as an empty "ok" result
+    if meta is not None:
+        save_cached_result(output_dir, source_hash, result)
+    return finish(result)
 
 
 def main():
@@ -339,6 +499,12 @@ def main():
     parser = argparse.ArgumentParser(description="Batch extract financial tables from FIBRA reports")
     parser.add_argument("pdf_directory", help="Directory containing PDF reports")
     parser.add_argument("--output-dir", help="Override output directory (default: next to each PDF)")
+    parser.add_argument("--workers", type=int, default=min(os.cpu_count() or 1, 4),
+                        help="Parallel worker processes (default: min(cpu_count, 4))")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Run scan/extract in child interpreters for crash isolation")
+    parser.add_argument("--force", action="store_true",
+                        help="Reprocess every PDF even if cached results match")
     args = parser.parse_args()
 
     pdf_dir = Path(args.pdf_directory)
@@ -346,49 +512,76 @@ def main():
         print(f"Error: {pdf_dir} is not a directory", file=sys.stderr)
         sys.exit(1)
 
-    pdfs = sorted(pdf_dir.glob("*.pdf"), key=lambda p: p.name)
+    # scandir reads the dirent type without stat'ing each entry, which
+    # beats Path.glob on directories with thousands of files
+    with os.scandir(pdf_dir) as it:
+        pdfs = sorted(
+            (Path(entry.path) for entry in it
+             if entry.is_file() and entry.name.lower().endswith(".pdf")),
+            key=lambda p: p.name,
+        )
     if not pdfs:
         print(f"Error: No PDF files found in {pdf_dir}", file=sys.stderr)
         sys.exit(1)
 
     print(f"Found {len(pdfs)} PDF reports to process", file=sys.stderr)
 
-    results = []
-    for pdf_path in pdfs:
-        result = process_pdf(pdf_path, args.output_dir)
-        results.append(result)
+    # Stream each result to stdout as it completes instead of holding the
+    # whole batch (including extraction metadata) in memory; only light
+    # counters stay resident
+    out = sys.stdout.buffer
+    out.write(b'{"results": [')
+
+    total = 0
+    ok_count = 0
+    type_counts = {}
+
+    def emit(result):
+        nonlocal total, ok_count
+        if total:
+            out.write(b", ")
+        out.write(json.dumps(result, ensure_ascii=False).encode("utf-8"))
+        out.flush()
+        total += 1
+        if result["status"] == "ok":
+            ok_count += 1
+        for stmt_type in result["tables"]:
+            type_counts[stmt_type] = type_counts.get(stmt_type, 0) + 1
+
+    if args.workers > 1 and len(pdfs) > 1:
+        worker = functools.partial(process_pdf, output_base=args.output_dir,
+                                   isolate=args.isolate, force=args.force)
+        # imap_unordered lets fast PDFs finish ahead of slow ones instead
+        # of blocking on in-order delivery; chunking cuts per-task IPC
+        chunksize = max(1, len(pdfs) // (args.workers * 4))
+        with multiprocessing.Pool(args.workers) as pool:
+            for result in pool.imap_unordered(worker, pdfs, chunksize=chunksize):
+                emit(result)
+    else:
+        for pdf_path in pdfs:
+            emit(process_pdf(pdf_path, args.output_dir, isolate=args.isolate,
+                             force=args.force))
+
+    fail_count = total - ok_count
+    out.write(
+        f'], "total_pdfs": {total}, "successful": {ok_count}, '
+        f'"failed": {fail_count}}}\n'.encode("utf-8")
+    )
+    out.flush()
 
     # Summary
     print(f"\n{'='*60}", file=sys.stderr)
     print(f"BATCH EXTRACTION COMPLETE", file=sys.stderr)
     print(f"{'='*60}", file=sys.stderr)
 
-    ok_count = sum(1 for r in results if r["status"] == "ok")
-    fail_count = len(results) - ok_count
-    print(f"  Processed: {len(results)} PDFs", file=sys.stderr)
+    print(f"  Processed: {total} PDFs", file=sys.stderr)
     print(f"  Successful: {ok_count}", file=sys.stderr)
     if fail_count:
         print(f"  Failed: {fail_count}", file=sys.stderr)
 
-    # Statement type coverage
-    all_types = set()
-    for r in results:
-        all_types.update(r["tables"].keys())
-
     print(f"\n  Statement types found across all reports:", file=sys.stderr)
-    for stmt_type in sorted(all_types):
-        periods = [r["period"] for r in results if stmt_type in r["tables"]]
-        print(f"    {stmt_type}: {len(periods)} quarters", file=sys.stderr)
-
-    # Write summary JSON to stdout
-    summary = {
-        "total_pdfs": len(results),
-        "successful": ok_count,
-        "failed": fail_count,
-        "results": results,
-    }
-    sys.stdout.buffer.write(json.dumps(summary, indent=2, ensure_ascii=False).encode("utf-8"))
-    sys.stdout.buffer.write(b"\n")
+    for stmt_type in sorted(type_counts):
+        print(f"    {stmt_type}: {type_counts[stmt_type]} quarters", file=sys.stderr)
 
 
 if __name__ == "__main__":
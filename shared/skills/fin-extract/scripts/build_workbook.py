@@ -8,16 +8,45 @@ Usage:
 """
 
 import csv
+import functools
+import os
 import re
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, numbers
-from openpyxl.utils import get_column_letter
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle, numbers
+from openpyxl.worksheet.dimensions import ColumnDimension
+from openpyxl.writer.excel import ExcelWriter
 
 QUARTER_RE = re.compile(r"(\d)[QqTt](\d{2})")
 
+# Hot-path patterns, compiled once. The re module caches compiled patterns,
+# but the per-call cache lookup still costs more than a bound method.
+_PURE_NUM_RE = re.compile(r"^-?\d[\d.]*%?$")
+_PAREN_ANNOT_RE = re.compile(r"\s*\(\d+\)\s*$")
+_NET_ANNOT_RE = re.compile(r"\s*\(net\)\s*$", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+_PORTFOLIO_RE = re.compile(r"\s*\((own|consolidated)\s*portfolio\)")
+# Noise rows in standard CSVs: known metadata prefixes (anchored) or the
+# "days of operation" marker anywhere; one search replaces a startswith
+# tuple plus a substring check per row
+_NOISE_LABEL_RE = re.compile(
+    r"^(?:note:|fibra soma|mexican pesos|soma21|closing price|outstanding cbfi"
+    r"|market capitalization|mxn\$|interest affo|•|we |showing |affo |to )"
+    r"|days of operation"
+)
+# Orphan fragments: a bare year ("2021.") or "to 2021." leaked from PDF text
+_ORPHAN_RE = re.compile(r"^(?:to )?\d{4}\.$")
+_DIGIT_COMMA_RE = re.compile(r"^[\d,]+$")
+_LEADING_NUM_RE = re.compile(r"^(\$[\d,]+(?:\.\d+)?)\s*(.*)")
+_CF_NUM_RE = re.compile(r"^([\$\(\)\-\d,.]+)\s*(.*)")
+_CF_NUM_TRAIL_RE = re.compile(r"^[\$\(\)\-\d,.]+\s+(.*)")
+_TABLES_DIR_RE = re.compile(r"(\d[Qq]\d{2})")
+
 # Periods to skip per statement type (corrupted or non-tabular data)
 SKIP_PERIODS = {
     "noi_ebitda": {"1Q21", "2Q21"},
@@ -33,26 +62,71 @@ TAB_CONFIG = [
 ]
 
 
+@functools.lru_cache(maxsize=1024)
 def period_sort_key(period):
-    m = QUARTER_RE.match(period.upper())
-    if m:
-        return (int(m.group(2)), int(m.group(1)))
+    # Cached: the same period strings are sorted once per statement type.
+    # Inlined QUARTER_RE.match — the slice checks admit exactly the same
+    # strings (isdecimal is the \d character set) without regex dispatch
+    u = period.upper()
+    if len(u) >= 4 and u[1] in "QT" and u[0].isdecimal() and u[2:4].isdecimal():
+        return (int(u[2:4]), int(u[0]))
     return (99, 99)
 
 
+class ParsedCSV:
+    """A CSV's rows plus the header metadata every parser needs.
+
+    Computed in one streaming pass at read time so no parser has to
+    re-scan the rows for the header or the column count.
+    """
+
+    __slots__ = ("rows", "ncols", "header_idx")
+
+    def __init__(self, rows):
+        self.rows = rows
+        ncols = 0
+        header_idx = None
+        for i, row in enumerate(rows):
+            if len(row) > ncols:
+                ncols = len(row)
+            if header_idx is None and _is_header_row(row):
+                header_idx = i
+        self.ncols = ncols
+        self.header_idx = header_idx
+
+
+@functools.lru_cache(maxsize=None)
+def _read_csv_cached(resolved_path):
+    with open(resolved_path, "r", encoding="utf-8") as f:
+        return ParsedCSV(list(csv.reader(f)))
+
+
 def read_csv(csv_path):
-    with open(csv_path, "r", encoding="utf-8") as f:
-        return list(csv.reader(f))
+    """Read a CSV into a ParsedCSV, cached by resolved path.
+
+    Parsers treat the result as read-only, so repeat reads of the same
+    file (e.g. a statement probed by more than one parser) share one
+    parse and one header scan.
+    """
+    return _read_csv_cached(str(Path(csv_path).resolve()))
 
 
 def clean_value(raw):
     """Parse a dollar-formatted string into a float, or return None."""
-    if not raw or not raw.strip():
+    if not raw:
         return None
     s = raw.strip()
+    if not s:
+        return None
+    # Prefilter: a cell can only clean to a number if it starts with a
+    # digit or one of the characters later stripping removes ('(', '$',
+    # ',', '-', em dash) — everything else (labels, narrative text) bails
+    # here without any further string work
+    if s[0] not in "0123456789($,-—":
+        return None
     # Handle parenthetical negatives: ($123,456) or (123,456)
     neg = False
-    if s.startswith("(") and s.endswith(")"):
+    if s[0] == "(" and s[-1] == ")":
         neg = True
         s = s[1:-1].strip()
     if s.startswith("($") and not neg:
@@ -62,11 +136,18 @@ def clean_value(raw):
     if not s or s == "-" or s == "—":
         return 0.0
     s = s.replace(",", "")
-    # Reject strings that don't look like numbers
-    if not re.match(r"^-?\d[\d.]*%?$", s):
+    if not s:
         return None
     if s.endswith("%"):
-        return s  # preserve percentage as string
+        # Rare branch; keep the full validating regex here
+        return s if _PURE_NUM_RE.match(s) else None
+    # Digits-and-dots guard replaces the validating regex on the hot path:
+    # it admits exactly what the regex did (so float() can't sneak in
+    # exponents, inf/nan, or '+' signs) while float() itself rejects
+    # malformed dot placement
+    body = s[1:] if s[0] == "-" else s
+    if not body or not body[0].isdigit() or not body.replace(".", "").isdigit():
+        return None
     try:
         val = float(s)
         return -val if neg else val
@@ -74,25 +155,34 @@ def clean_value(raw):
         return None
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_label(label):
-    """Normalize a label for fuzzy matching across quarters."""
+    """Normalize a label for fuzzy matching across quarters.
+
+    Cached: the same line-item labels recur every quarter, so alignment
+    across ~20 periods hits the cache far more often than it misses.
+    """
     s = label.lower().strip()
-    # Strip trailing annotations like (1), (2), (Net), etc.
-    s = re.sub(r"\s*\(\d+\)\s*$", "", s)
-    s = re.sub(r"\s*\(net\)\s*$", "", s, flags=re.IGNORECASE)
+    # Strip trailing annotations like (1), (2), (Net), etc. — all of the
+    # parenthetical patterns need a "(" to fire, so most labels skip the
+    # regex passes on a single membership check
+    if "(" in s:
+        s = _PAREN_ANNOT_RE.sub("", s)
+        s = _NET_ANNOT_RE.sub("", s)
     # Normalize common spelling variants
-    s = s.replace("non-operating", "non operating")
-    s = s.replace("non-operation", "non operating")
-    s = s.replace("non operating", "non operating")
-    s = s.replace("non operation", "non operating")
+    if "non" in s:
+        s = s.replace("non-operating", "non operating")
+        s = s.replace("non-operation", "non operating")
+        s = s.replace("non operation", "non operating")
     # Remove trailing periods and colons for comparison
     s = s.rstrip(".:;")
     # Collapse whitespace
-    s = re.sub(r"\s+", " ", s)
+    s = _WS_RE.sub(" ", s)
     # Remove leading dollar signs, bullets, "A: " / "L: " prefixes
     s = s.lstrip("$•·- ")
     # Remove parenthetical qualifiers for matching
-    s = re.sub(r"\s*\((own|consolidated)\s*portfolio\)", "", s)
+    if "(" in s:
+        s = _PORTFOLIO_RE.sub("", s)
     return s
 
 
@@ -100,15 +190,29 @@ def normalize_label(label):
 # Parsers — each returns [(label, value), ...] for the current period
 # ---------------------------------------------------------------------------
 
-def find_header_row(rows):
-    """Find the row index containing period patterns like '3Q25' or 'Thousand'."""
-    for i, row in enumerate(rows):
-        joined = " ".join(row)
-        if QUARTER_RE.search(joined):
-            return i
-        if "thousand" in joined.lower() and ("pesos" in joined.lower() or any(QUARTER_RE.search(c) for c in row)):
-            return i
-    return None
+def _is_header_row(row):
+    """True if the row contains period patterns like '3Q25' or 'Thousand'.
+
+    Scans cell by cell rather than joining the row first: neither the
+    quarter pattern nor the keyword tokens can span a cell boundary, and
+    skipping the join avoids an O(ncols) allocation per probed row.
+    """
+    for cell in row:
+        if QUARTER_RE.search(cell):
+            return True
+    return any("thousand" in c.lower() for c in row) and any(
+        "pesos" in c.lower() for c in row
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _normalized_header(header):
+    """Uppercase, space-free copies of a header tuple, cached per header.
+
+    The same header row is probed once per parser that touches the file,
+    so the per-cell normalization is paid only on the first probe.
+    """
+    return tuple(cell.upper().replace(" ", "") for cell in header)
 
 
 def find_period_column(header_row, period):
@@ -120,25 +224,24 @@ def find_period_column(header_row, period):
     period_upper = period.upper()
     # Also try the T-variant (Spanish reports use e.g. "2T25" instead of "2Q25")
     t_variant = period_upper.replace("Q", "T")
-    for i, cell in enumerate(header_row):
-        normalized = cell.upper().replace(" ", "")
+    for i, normalized in enumerate(_normalized_header(tuple(header_row))):
         if period_upper in normalized or t_variant in normalized:
             return i
     return None
 
 
-def parse_standard_csv(rows, period):
+def parse_standard_csv(parsed, period):
     """Parse income statement, NOI/EBITDA, and FFO/AFFO CSVs.
 
     These have a header row with period labels, label column 0 (or sometimes 1
     for FFO/AFFO with an empty col 0), and values in the period's column.
     """
-    header_idx = find_header_row(rows)
+    header_idx = parsed.header_idx
     if header_idx is None:
         return []
 
-    header = rows[header_idx]
-    period_col = find_period_column(header, period)
+    rows = parsed.rows
+    period_col = find_period_column(rows[header_idx], period)
     if period_col is None:
         return []
 
@@ -147,7 +250,8 @@ def parse_standard_csv(rows, period):
     label_col = 0
 
     results = []
-    for row in rows[header_idx + 1:]:
+    for ri in range(header_idx + 1, len(rows)):
+        row = rows[ri]
         if len(row) <= max(label_col, period_col):
             continue
         label = row[label_col].strip()
@@ -160,18 +264,13 @@ def parse_standard_csv(rows, period):
 
         # Skip metadata/noise rows
         lower_label = label.lower()
-        if lower_label.startswith(("note:", "fibra soma", "mexican pesos",
-                                   "soma21", "closing price", "outstanding cbfi",
-                                   "market capitalization", "mxn$", "interest affo",
-                                   "\u2022", "we ", "showing ", "affo ", "to ")):
-            continue
-        if "days of operation" in lower_label:
+        if _NOISE_LABEL_RE.search(lower_label):
             continue
         # Skip narrative text (full sentences that leaked from PDF)
         if len(label) > 60 and " " in label:
             continue
         # Skip orphan fragments (just a year, or very short non-label strings)
-        if re.match(r"^\d{4}\.$", label) or re.match(r"^to \d{4}\.$", lower_label):
+        if _ORPHAN_RE.match(lower_label):
             continue
 
         val_str = row[period_col] if period_col < len(row) else ""
@@ -198,7 +297,7 @@ def _parse_split_value(row, val_col):
     # If the next column has a pure numeric continuation, combine them
     if next_col < len(row):
         c2 = row[next_col].strip().lstrip(",")
-        if c2 and re.match(r"^[\d,]+$", c2):
+        if c2 and _DIGIT_COMMA_RE.match(c2):
             num_part = raw.lstrip("$").strip().rstrip(",")
             neg = "(" in raw
             num_part = num_part.lstrip("(").rstrip(")")
@@ -218,13 +317,6 @@ def _parse_split_value(row, val_col):
     return val
 
 
-EXPENSE_KEYWORDS = frozenset([
-    "operation and maintenance", "operation fee", "administrator expenses",
-    "property tax", "property insurance", "cost of land sales",
-    "total expenses", "other non-operation",
-])
-
-
 def _normalize_expense_signs(pairs):
     """Negate expense line items that were extracted as positive.
 
@@ -247,22 +339,23 @@ def _normalize_expense_signs(pairs):
             result.append((label, val))
             continue
 
+        # Everything between "Total revenues" and "Total expenses" is an
+        # expense line; zone membership alone decides the sign flip
         if in_expense_zone and val is not None and isinstance(val, (int, float)) and val > 0:
-            if any(kw in lower for kw in EXPENSE_KEYWORDS) or in_expense_zone:
-                val = -val
+            val = -val
 
         result.append((label, val))
     return result
 
 
 def parse_income_statement(csv_path, period):
-    rows = read_csv(csv_path)
+    parsed = read_csv(csv_path)
 
     # 1Q21 has a unique format: full pesos, split values, different headers
     if period.upper() == "1Q21":
-        pairs = _parse_income_statement_1q21(rows)
+        pairs = _parse_income_statement_1q21(parsed.rows)
     else:
-        pairs = parse_standard_csv(rows, period)
+        pairs = parse_standard_csv(parsed, period)
 
     return _normalize_expense_signs(pairs)
 
@@ -294,31 +387,36 @@ def _parse_income_statement_1q21(rows):
 
 
 def parse_noi_ebitda(csv_path, period):
-    rows = read_csv(csv_path)
-    return parse_standard_csv(rows, period)
+    return parse_standard_csv(read_csv(csv_path), period)
 
 
 def parse_ffo_affo(csv_path, period):
     """Parse FFO/AFFO — uses standard parser but the label column may be 0 or
     offset. Also some CSVs have an empty col between label and values."""
-    rows = read_csv(csv_path)
-    header_idx = find_header_row(rows)
+    parsed = read_csv(csv_path)
+    header_idx = parsed.header_idx
     if header_idx is None:
         return []
 
-    header = rows[header_idx]
-    period_col = find_period_column(header, period)
+    rows = parsed.rows
+    period_col = find_period_column(rows[header_idx], period)
     if period_col is None:
         return []
 
-    # Detect label column: scan data rows to see if col 0 has diverse labels
+    # Detect label column: scan data rows to see if col 0 has diverse labels.
+    # Only "two or fewer distinct values" matters, so stop as soon as a
+    # third distinct value rules the repeated-section-header case out.
     label_col = 0
-    col0_vals = set()
+    col0_vals = []
     for row in rows[header_idx + 1: header_idx + 10]:
         if row:
-            col0_vals.add(row[0].strip())
+            v = row[0].strip()
+            if v not in col0_vals:
+                col0_vals.append(v)
+                if len(col0_vals) > 2:
+                    break
     # If col 0 is always the same value (section header), labels are in col 1
-    if len(col0_vals) <= 2 and any(len(v) > 0 for v in col0_vals):
+    if len(col0_vals) <= 2:
         non_empty = [v for v in col0_vals if v]
         if len(non_empty) == 1:
             label_col = 1 if len(rows[header_idx + 1]) > 1 else 0
@@ -381,7 +479,7 @@ def parse_balance_sheet_3q25_plus(rows, period):
         # Or value is cleanly in a separate position.
 
         # Check if cell1 has a value at the start
-        val_match = re.match(r"^(\$[\d,]+(?:\.\d+)?)\s*(.*)", cell1)
+        val_match = _LEADING_NUM_RE.match(cell1)
         if val_match and label0 and ":" not in label0:
             asset_val = clean_value(val_match.group(1))
             liab_label = val_match.group(2).strip()
@@ -417,14 +515,16 @@ def parse_balance_sheet_3q25_plus(rows, period):
     return results
 
 
-def parse_balance_sheet_pre3q25(rows, period):
+def parse_balance_sheet_pre3q25(rows, period, ncols):
     """Pre-3Q25 balance sheet: side-by-side layout.
     Typical structure (1Q22-2Q25): 6 columns.
     Col 0 = section group, col 1 = asset label, col 2 = asset value,
     col 3 = liabilities section, col 4 = liab label, col 5 = liab value.
+
+    ncols comes from the dispatcher (ParsedCSV already counted it), so no
+    extra pass over the rows is needed here.
     """
     results = []
-    ncols = max((len(r) for r in rows), default=0)
 
     if ncols <= 6:
         # Standard 6-column layout (3Q21 through ~2Q25)
@@ -474,40 +574,43 @@ def parse_balance_sheet_pre3q25(rows, period):
         # Wide format (2Q24 style: 30+ columns with lots of empty cells)
         # Values are scattered across columns. Find them by looking for
         # dollar amounts.
+        # Heuristic: first half of columns = assets, second half = liabilities
+        mid = ncols // 2
         for row in rows:
             joined = " ".join(row).lower()
             if "thousand" in joined or not any(c.strip() for c in row):
                 continue
 
-            # Find all non-empty cells and their positions
-            cells = [(i, c.strip()) for i, c in enumerate(row) if c.strip()]
-            if not cells:
-                continue
-
-            # Heuristic: first half of columns = assets, second half = liabilities
-            mid = ncols // 2
-            asset_cells = [(i, c) for i, c in cells if i < mid]
-            liab_cells = [(i, c) for i, c in cells if i >= mid]
-
-            # Extract asset label + value
-            a_labels = [c for _, c in asset_cells if clean_value(c) is None and c.lower() not in ("assets", "")]
-            a_values = [c for _, c in asset_cells if clean_value(c) is not None]
-            if a_labels and a_values:
-                results.append((f"A: {a_labels[-1]}", clean_value(a_values[-1])))
-            elif a_labels and not a_values:
-                lbl = a_labels[-1]
-                if "as of" not in lbl.lower() and lbl.lower() != "assets":
-                    results.append((f"A: {lbl}", None))
-
-            # Extract liabilities label + value
-            l_labels = [c for _, c in liab_cells if clean_value(c) is None and c.lower() not in ("", "liabilities")]
-            l_values = [c for _, c in liab_cells if clean_value(c) is not None]
-            if l_labels and l_values:
-                results.append((f"L: {l_labels[-1]}", clean_value(l_values[-1])))
-            elif l_labels and not l_values:
-                lbl = l_labels[-1]
-                if "as of" not in lbl.lower():
-                    results.append((f"L: {lbl}", None))
+            # One pass over the row, one clean_value per cell; only the last
+            # label and last value per side matter
+            a_label = l_label = None
+            a_val = l_val = None
+            a_has_val = l_has_val = False
+            for i, c in enumerate(row):
+                c = c.strip()
+                if not c:
+                    continue
+                v = clean_value(c)
+                if i < mid:
+                    if v is not None:
+                        a_val, a_has_val = v, True
+                    elif c.lower() != "assets":
+                        a_label = c
+                else:
+                    if v is not None:
+                        l_val, l_has_val = v, True
+                    elif c.lower() != "liabilities":
+                        l_label = c
+
+            if a_label and a_has_val:
+                results.append((f"A: {a_label}", a_val))
+            elif a_label and "as of" not in a_label.lower():
+                results.append((f"A: {a_label}", None))
+
+            if l_label and l_has_val:
+                results.append((f"L: {l_label}", l_val))
+            elif l_label and "as of" not in l_label.lower():
+                results.append((f"L: {l_label}", None))
 
     return results
 
@@ -532,7 +635,7 @@ def parse_balance_sheet_1q21(rows, period):
         if len(row) > 2 and row[2].strip():
             # Check if col2 is a continuation of the number
             c2 = row[2].strip().lstrip(",")
-            if re.match(r"^[\d,]+$", c2):
+            if _DIGIT_COMMA_RE.match(c2):
                 # Combine: strip $ and whitespace from col1, append col2
                 num_part = raw_val.lstrip("$").strip().rstrip(",").lstrip("(").rstrip(")")
                 combined = num_part + c2
@@ -559,8 +662,7 @@ def parse_balance_sheet_1q21(rows, period):
             if isinstance(val, float) and abs(val) > 100000:
                 val = round(val / 1000, 0)
 
-            lower_l = label.lower()
-            if any(x in lower_l for x in ["liabilit", "equity", "payable", "debt", "deposit",
+            if any(x in lower for x in ["liabilit", "equity", "payable", "debt", "deposit",
                                            "tenant admission", "acquisition real estate",
                                            "other accounts pay", "securit", "trust", "contribut",
                                            "controlling", "stockholder", "ipo expenses",
@@ -568,19 +670,20 @@ def parse_balance_sheet_1q21(rows, period):
                 results.append((f"L: {label}", val))
             else:
                 results.append((f"A: {label}", val))
-        elif ":" in label or label.lower().startswith(("current", "non-current", "non current", "stockholder")):
-            side = "L" if any(x in label.lower() for x in ["liabilit", "equity", "stockholder"]) else "A"
+        elif ":" in label or lower.startswith(("current", "non-current", "non current", "stockholder")):
+            side = "L" if any(x in lower for x in ["liabilit", "equity", "stockholder"]) else "A"
             results.append((f"{side}: {label}", None))
 
     return results
 
 
 def parse_balance_sheet(csv_path, period):
-    rows = read_csv(csv_path)
+    parsed = read_csv(csv_path)
+    rows = parsed.rows
     if not rows:
         return []
 
-    ncols = max(len(r) for r in rows)
+    ncols = parsed.ncols
 
     # 1Q21 has a unique format (full pesos, different labels)
     if period.upper() == "1Q21":
@@ -591,7 +694,7 @@ def parse_balance_sheet(csv_path, period):
         return parse_balance_sheet_3q25_plus(rows, period)
 
     # Everything else
-    return parse_balance_sheet_pre3q25(rows, period)
+    return parse_balance_sheet_pre3q25(rows, period, ncols)
 
 
 def parse_cash_flow(csv_path, period):
@@ -600,7 +703,7 @@ def parse_cash_flow(csv_path, period):
     These have a dual-column layout: left side = operating activities,
     right side = investing/financing. Labels and values interleave.
     """
-    rows = read_csv(csv_path)
+    rows = read_csv(csv_path).rows
     if not rows:
         return []
 
@@ -631,12 +734,16 @@ def _maybe_rescale_to_thousands(pairs):
     If the median absolute value of numeric entries exceeds 10M, the data
     is in full pesos and needs dividing by 1000.
     """
-    numeric_vals = [abs(v) for _, v in pairs if isinstance(v, (int, float)) and v != 0]
-    if not numeric_vals:
-        return pairs
-    numeric_vals.sort()
-    median = numeric_vals[len(numeric_vals) // 2]
-    if median > 10_000_000:
+    # The median only gets compared against a threshold, so there is no
+    # need to materialize and sort the values: median > T exactly when the
+    # upper half of the entries exceeds T. One counting pass suffices.
+    total = over = 0
+    for _, v in pairs:
+        if isinstance(v, (int, float)) and v != 0:
+            total += 1
+            if abs(v) > 10_000_000:
+                over += 1
+    if total and over >= total - total // 2:
         return [(label, round(v / 1000, 0) if isinstance(v, (int, float)) else v) for label, v in pairs]
     return pairs
 
@@ -701,7 +808,7 @@ def _parse_cash_flow_standard(rows, concept_row_idx):
         left_val_col = None
         for ci in range(1, min(3, len(row))):
             cell = row[ci].strip()
-            num_match = re.match(r"^([\$\(\)\-\d,.]+)\s*(.*)", cell)
+            num_match = _CF_NUM_RE.match(cell)
             if num_match:
                 cv = clean_value(num_match.group(1))
                 if cv is not None:
@@ -731,7 +838,7 @@ def _parse_cash_flow_standard(rows, concept_row_idx):
                 continue
 
             if left_val_col is not None and ci == left_val_col:
-                num_match = re.match(r"^[\$\(\)\-\d,.]+\s+(.*)", cell)
+                num_match = _CF_NUM_TRAIL_RE.match(cell)
                 if num_match:
                     trailing = num_match.group(1).strip()
                     if trailing and len(trailing) > 2:
@@ -768,39 +875,40 @@ def align_labels(all_data):
 
     Returns: (master_labels, {period: {label: value}})
     """
-    master = []
-    master_norm = []
+    # Master list as a singly linked list of [label, next] nodes: inserting
+    # a new label after the previously matched one is O(1), where
+    # list.insert would shift the tail on every mid-list insert
+    head = [None, None]  # sentinel
+    norm_to_node = {}  # normalized key -> node, for O(1) matching
     period_maps = {}
 
     for period, pairs in all_data:
         pmap = {}
-        prev_master_idx = -1
+        prev_node = head
 
         for label, val in pairs:
             nkey = normalize_label(label)
 
-            # Find match in master list
-            found_idx = None
-            for mi, mn in enumerate(master_norm):
-                if mn == nkey:
-                    found_idx = mi
-                    break
-
-            if found_idx is not None:
+            node = norm_to_node.get(nkey)
+            if node is not None:
                 # Use the canonical label from master
-                canonical = master[found_idx]
-                pmap[canonical] = val
-                prev_master_idx = found_idx
+                pmap[node[0]] = val
             else:
-                # New label — insert after the last matched position
-                insert_pos = prev_master_idx + 1
-                master.insert(insert_pos, label)
-                master_norm.insert(insert_pos, nkey)
+                # New label — splice in after the last matched position
+                node = [label, prev_node[1]]
+                prev_node[1] = node
+                norm_to_node[nkey] = node
                 pmap[label] = val
-                prev_master_idx = insert_pos
+            prev_node = node
 
         period_maps[period] = pmap
 
+    master = []
+    node = head[1]
+    while node is not None:
+        master.append(node[0])
+        node = node[1]
+
     return master, period_maps
 
 
@@ -814,65 +922,130 @@ HEADER_FONT_WHITE = Font(bold=True, size=11, color="FFFFFF")
 SECTION_FONT = Font(bold=True, size=10)
 NUMBER_FMT = '#,##0'
 NEG_NUMBER_FMT = '#,##0;(#,##0)'
+# Shared Alignment instances — constructing one per cell allocates and
+# validates the same immutable object thousands of times per workbook
+ALIGN_LEFT = Alignment(horizontal="left")
+ALIGN_CENTER = Alignment(horizontal="center")
+ALIGN_RIGHT = Alignment(horizontal="right")
+
+
+def _ensure_styles(wb):
+    """Register the model-tab styles on the workbook, once per workbook.
+
+    Assigning cell.style = <name> is a single lookup into the workbook's
+    style table, where setting font/fill/alignment/number_format per cell
+    inserts into (and later deduplicates against) the style tables for
+    every styled cell.
+    """
+    if "model_header_left" in wb.named_styles:
+        return
+    for style in (
+        NamedStyle(name="model_header_left", font=HEADER_FONT_WHITE,
+                   fill=HEADER_FILL, alignment=ALIGN_LEFT),
+        NamedStyle(name="model_header", font=HEADER_FONT_WHITE,
+                   fill=HEADER_FILL, alignment=ALIGN_CENTER),
+        NamedStyle(name="model_section", font=SECTION_FONT),
+        NamedStyle(name="model_number", number_format=NEG_NUMBER_FMT,
+                   alignment=ALIGN_RIGHT),
+        NamedStyle(name="model_percent", alignment=ALIGN_RIGHT),
+    ):
+        wb.add_named_style(style)
+
+
+def _make_label_cell(ws, label, is_section):
+    cell = WriteOnlyCell(ws, value=label)
+    if is_section:
+        cell.style = "model_section"
+    return cell
+
+
+def _make_value_cell(ws, val):
+    """Wrap a period value for append.
+
+    Exact type dispatch: clean_value only ever produces floats, percent
+    strings, or None, so type() checks beat isinstance chains in the
+    per-cell loop. Unstyled values pass through bare — the fastest path
+    through ws.append.
+    """
+    t = type(val)
+    if t is float or t is int:
+        cell = WriteOnlyCell(ws, value=val)
+        cell.style = "model_number"
+        return cell
+    if t is str and val.endswith("%"):
+        cell = WriteOnlyCell(ws, value=val)
+        cell.style = "model_percent"
+        return cell
+    return val
 
 
 def write_model_tab(wb, tab_name, master_labels, period_maps, periods):
+    _ensure_styles(wb)
     ws = wb.create_sheet(title=tab_name[:31])
 
-    # Row 1: header — col A = blank or "Thousand Pesos", cols B+ = periods
-    ws.cell(row=1, column=1, value="Thousand Pesos").font = HEADER_FONT_WHITE
-    ws.cell(row=1, column=1).fill = HEADER_FILL
-    ws.cell(row=1, column=1).alignment = Alignment(horizontal="left")
+    # Interned copies: openpyxl's shared-strings table hashes every string
+    # cell on append, and labels repeat across tabs — identity-equal
+    # strings short-circuit that dict lookup
+    master_labels = [sys.intern(label) for label in master_labels]
+    periods = [sys.intern(p) for p in periods]
 
-    for pi, period in enumerate(periods):
-        cell = ws.cell(row=1, column=pi + 2, value=period)
-        cell.font = HEADER_FONT_WHITE
-        cell.fill = HEADER_FILL
-        cell.alignment = Alignment(horizontal="center")
+    # Write-only sheets stream each appended row straight to the archive,
+    # so sheet-level state (freeze panes, column widths) must be set before
+    # the first append — and widths come from the label list, not a reread
+    ws.freeze_panes = "B2"
+    max_a = max((len(label) for label in master_labels), default=0)
+    ws.column_dimensions["A"].width = min(max(max_a, 20) + 2, 60)
+    if periods:
+        # One grouped dimension covers every period column — a single
+        # <col min="2" max="N"/> element instead of one entry per period
+        ws.column_dimensions["B"] = ColumnDimension(
+            ws, index="B", min=2, max=len(periods) + 1, width=14, customWidth=True
+        )
 
-    # Data rows
-    for ri, label in enumerate(master_labels):
-        row_num = ri + 2
-        label_cell = ws.cell(row=row_num, column=1, value=label)
+    # Row 1: header — col A = blank or "Thousand Pesos", cols B+ = periods
+    cell = WriteOnlyCell(ws, value="Thousand Pesos")
+    cell.style = "model_header_left"
+    header = [cell]
+    for period in periods:
+        cell = WriteOnlyCell(ws, value=period)
+        cell.style = "model_header"
+        header.append(cell)
+    ws.append(header)
+
+    # Hoist the per-period dicts and precompute which labels carry any
+    # value, so the section test below is one set lookup instead of a
+    # scan over every period per row
+    pmaps = [period_maps.get(p, {}) for p in periods]
+    present = set()
+    for pmap in pmaps:
+        present.update(k for k, v in pmap.items() if v is not None)
+
+    # Data rows: styled cells are wrapped in WriteOnlyCell, plain values
+    # pass through as-is; each row is released to the writer on append
+    for label in master_labels:
+        has_values = label in present
 
         # Bold section headers (labels ending with ":")
         is_section = label.rstrip().endswith(":") or (
-            clean_value(label) is None and
-            all(period_maps.get(p, {}).get(label) is None for p in periods)
+            not has_values and clean_value(label) is None
         )
-        if is_section:
-            label_cell.font = SECTION_FONT
-
-        for pi, period in enumerate(periods):
-            val = period_maps.get(period, {}).get(label)
-            if val is None:
-                continue
-            cell = ws.cell(row=row_num, column=pi + 2)
-            if isinstance(val, str) and val.endswith("%"):
-                cell.value = val
-                cell.alignment = Alignment(horizontal="right")
-            elif isinstance(val, (int, float)):
-                cell.value = val
-                cell.number_format = NEG_NUMBER_FMT
-                cell.alignment = Alignment(horizontal="right")
-            else:
-                cell.value = val
-
-    # Freeze pane at B2 (scroll data, keep labels and header visible)
-    ws.freeze_panes = "B2"
+        label_cell = _make_label_cell(ws, label, is_section)
 
-    # Auto-width
-    # Column A (labels): measure content
-    max_a = 20
-    for ri in range(1, len(master_labels) + 2):
-        cell = ws.cell(row=ri, column=1)
-        if cell.value:
-            max_a = max(max_a, len(str(cell.value)))
-    ws.column_dimensions["A"].width = min(max_a + 2, 60)
+        # Rows with no value in any period (section headers mostly) skip
+        # the per-period lookups entirely
+        if not has_values:
+            ws.append([label_cell])
+            continue
 
-    # Period columns: fixed width
-    for pi in range(len(periods)):
-        ws.column_dimensions[get_column_letter(pi + 2)].width = 14
+        # Preallocated buffer: empty periods stay None (nothing is written
+        # for them) and only real values pay for cell construction
+        row = [None] * (len(pmaps) + 1)
+        row[0] = label_cell
+        for pi, pmap in enumerate(pmaps):
+            val = pmap.get(label)
+            if val is not None:
+                row[pi + 1] = _make_value_cell(ws, val)
+        ws.append(row)
 
     return ws
 
@@ -881,29 +1054,42 @@ def write_model_tab(wb, tab_name, master_labels, period_maps, periods):
 # Orchestration
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def _scan_tables_dirs(parent_dir):
+    """List (period, path) for every *_tables directory under parent_dir.
+
+    One os.scandir pass shared by all statement types — DirEntry carries
+    the stat result, so the is_dir check costs no extra syscall, and the
+    five discover_csvs calls per run reuse the same listing.
+    """
+    found = []
+    with os.scandir(parent_dir) as it:
+        for entry in it:
+            if not entry.name.endswith("_tables"):
+                continue
+            m = _TABLES_DIR_RE.match(entry.name)
+            if not m or not entry.is_dir():
+                continue
+            found.append((m.group(1).upper(), entry.path))
+    return tuple(found)
+
+
 def discover_csvs(parent_dir, stmt_type):
     """Find all primary CSVs for a statement type, return [(period, path)] sorted."""
-    parent = Path(parent_dir)
     results = []
     skip = SKIP_PERIODS.get(stmt_type, set())
 
-    for tables_dir in parent.glob("*_tables"):
-        if not tables_dir.is_dir():
-            continue
-        m = re.match(r"(\d[Qq]\d{2})", tables_dir.name)
-        if not m:
-            continue
-        period = m.group(1).upper()
+    for period, dir_path in _scan_tables_dirs(str(parent_dir)):
         if period in skip:
             continue
 
-        csv_file = tables_dir / f"{stmt_type}_{period.lower()}.csv"
-        if not csv_file.exists():
-            csv_file = tables_dir / f"{stmt_type}_{period}.csv"
-        if not csv_file.exists():
-            continue
+        candidate = os.path.join(dir_path, f"{stmt_type}_{period.lower()}.csv")
+        if not os.path.isfile(candidate):
+            candidate = os.path.join(dir_path, f"{stmt_type}_{period}.csv")
+            if not os.path.isfile(candidate):
+                continue
 
-        results.append((period, csv_file))
+        results.append((period, Path(candidate)))
 
     results.sort(key=lambda x: period_sort_key(x[0]))
     return results
@@ -918,6 +1104,12 @@ PARSERS = {
 }
 
 
+def _parse_one(job):
+    """Parse a single (stmt_type, period, csv_path) job; pool-friendly."""
+    stmt_type, period, csv_path = job
+    return stmt_type, period, PARSERS[stmt_type](csv_path, period)
+
+
 def build_workbook(parent_dir, output_path=None):
     parent = Path(parent_dir)
     if output_path is None:
@@ -925,36 +1117,63 @@ def build_workbook(parent_dir, output_path=None):
     else:
         output_path = Path(output_path)
 
-    wb = Workbook()
-    wb.remove(wb.active)
+    # Write-only mode streams rows to the XLSX archive as they are
+    # appended instead of materializing every cell object in memory;
+    # it also starts with no default sheet to remove
+    wb = Workbook(write_only=True)
 
-    for stmt_type, tab_name in TAB_CONFIG:
+    # Discover everything up front so parsing can fan out in one batch:
+    # each (statement type, period) CSV parse is independent CPU-bound work
+    discovered = {}
+    jobs = []
+    for stmt_type, _ in TAB_CONFIG:
         entries = discover_csvs(parent_dir, stmt_type)
+        discovered[stmt_type] = entries
+        jobs.extend((stmt_type, period, csv_path) for period, csv_path in entries)
+
+    parsed = {}
+    if len(jobs) > 1:
+        workers = min(os.cpu_count() or 1, 4, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for stmt_type, period, pairs in executor.map(_parse_one, jobs):
+                parsed[(stmt_type, period)] = pairs
+    else:
+        for job in jobs:
+            stmt_type, period, pairs = _parse_one(job)
+            parsed[(stmt_type, period)] = pairs
+
+    for stmt_type, tab_name in TAB_CONFIG:
+        entries = discovered[stmt_type]
         if not entries:
             print(f"  {tab_name}: no CSVs found, skipping", file=sys.stderr)
             continue
 
-        parser = PARSERS[stmt_type]
-        periods = [e[0] for e in entries]
-        print(f"  {tab_name}: {len(entries)} quarters ({periods[0]}–{periods[-1]})", file=sys.stderr)
+        print(f"  {tab_name}: {len(entries)} quarters ({entries[0][0]}–{entries[-1][0]})", file=sys.stderr)
 
+        # Single pass: collect the period list alongside the parsed pairs
         all_data = []
+        actual_periods = []
         for period, csv_path in entries:
-            pairs = parser(csv_path, period)
+            pairs = parsed[(stmt_type, period)]
             if not pairs:
                 print(f"    WARNING: no data extracted from {csv_path.name}", file=sys.stderr)
                 continue
             all_data.append((period, pairs))
+            actual_periods.append(period)
 
         if not all_data:
             continue
 
-        actual_periods = [p for p, _ in all_data]
         master_labels, period_maps = align_labels(all_data)
         write_model_tab(wb, tab_name, master_labels, period_maps, actual_periods)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(str(output_path))
+    # Same plumbing as wb.save, but with fast deflate: level 1 compresses
+    # these small XML payloads 2-3x quicker than zlib's default 6 for a
+    # size cost of a few percent
+    archive = zipfile.ZipFile(str(output_path), "w", zipfile.ZIP_DEFLATED,
+                              allowZip64=True, compresslevel=1)
+    ExcelWriter(wb, archive).save()
     print(f"\nWorkbook saved: {output_path}", file=sys.stderr)
     print(f"Tabs: {[ws.title for ws in wb.worksheets]}", file=sys.stderr)
     return str(output_path)
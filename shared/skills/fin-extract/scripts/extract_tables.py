@@ -7,71 +7,98 @@ converted to float — they stay as strings throughout, with Decimal used
 only for validation of row totals.
 
 Usage:
-    python extract_tables.py <pdf_path> <output_dir> <page_numbers>
+    python extract_tables.py <pdf_path> <output_dir> <page_numbers> [workers]
 
     page_numbers: comma-separated (5,6,7) or ranges (5-10)
+    workers: parallel page-extraction processes (default: min(cpu_count, 4))
 
 Output:
     <output_dir>/page_<N>_table_<M>.csv   — one CSV per detected table
     <output_dir>/_metadata.json            — extraction metadata and validation results
 """
 
+import bisect
 import csv
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 
-import pdfplumber
+try:
+    from _fastjson import dumps_indented
+except ImportError:
+    def dumps_indented(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
 
-def extract_table_with_words(page, table):
+
+def _nearest(sorted_vals, x):
+    """Nearest value in a sorted list, found by bisection."""
+    i = bisect.bisect_left(sorted_vals, x)
+    if i == 0:
+        return sorted_vals[0]
+    if i == len(sorted_vals):
+        return sorted_vals[-1]
+    before = sorted_vals[i - 1]
+    after = sorted_vals[i]
+    return after if after - x < x - before else before
+
+
+def extract_table_with_words(table, words):
     """Extract table data using page-level word detection for proper spacing.
 
     Instead of table.extract() which concatenates text within cells,
-    this uses page.extract_words() to get properly-spaced words, then
-    assigns them to cells based on spatial overlap.
+    this assigns properly-spaced words to cells based on spatial
+    position. Callers extract the word list once per page and thread it
+    in — pdfminer's word clustering is the dominant per-page cost, so it
+    must not rerun for every table and strategy.
     """
-    words = page.extract_words(x_tolerance=2, y_tolerance=3, keep_blank_chars=True)
     cells = table.cells
     if not cells:
         return table.extract(x_tolerance=15)
 
-    rows_dict = {}
-    for cell in cells:
-        x0, top, x1, bottom = cell
-        row_key = round(top, 0)
-        if row_key not in rows_dict:
-            rows_dict[row_key] = {}
+    # Collect both boundary sets in a single pass over the cells
+    row_set = set()
+    col_set = set()
+    for x0, top, x1, bottom in cells:
+        row_set.add(round(top, 0))
+        col_set.add(round(x0, 0))
 
-    row_keys = sorted(rows_dict.keys())
-    col_positions = sorted(set(round(c[0], 0) for c in cells))
+    row_keys = sorted(row_set)
+    col_positions = sorted(col_set)
 
     grid = {}
     for cell in cells:
         x0, top, x1, bottom = cell
-        row_key = min(row_keys, key=lambda r: abs(r - round(top, 0)))
-        col_key = min(col_positions, key=lambda c: abs(c - round(x0, 0)))
+        row_key = _nearest(row_keys, round(top, 0))
+        col_key = _nearest(col_positions, round(x0, 0))
         grid[(row_key, col_key)] = (x0, top, x1, bottom)
 
+    # Cells tile the page, so the enclosing cell is found by bisecting the
+    # sorted row/column boundaries — O(log C) per word instead of testing
+    # every cell with a smallest-area tiebreak
     cell_texts = {}
     for word in words:
         wx_center = (word["x0"] + word["x1"]) / 2
         wy_center = (word["top"] + word["bottom"]) / 2
 
-        best_cell = None
-        best_area = 0
-        for cell_key, (cx0, ctop, cx1, cbottom) in grid.items():
-            if cx0 - 2 <= wx_center <= cx1 + 2 and ctop - 2 <= wy_center <= cbottom + 2:
-                area = (cx1 - cx0) * (cbottom - ctop)
-                if best_cell is None or area < best_area:
-                    best_cell = cell_key
-                    best_area = area
+        ri = bisect.bisect_right(row_keys, wy_center) - 1
+        ci = bisect.bisect_right(col_positions, wx_center) - 1
+        if ri < 0 or ci < 0:
+            continue
 
-        if best_cell is not None:
-            if best_cell not in cell_texts:
-                cell_texts[best_cell] = []
-            cell_texts[best_cell].append((word["x0"], word["top"], word["text"]))
+        key = (row_keys[ri], col_positions[ci])
+        cell = grid.get(key)
+        if cell is None:
+            continue
+
+        cx0, ctop, cx1, cbottom = cell
+        if cx0 - 2 <= wx_center <= cx1 + 2 and ctop - 2 <= wy_center <= cbottom + 2:
+            if key not in cell_texts:
+                cell_texts[key] = []
+            cell_texts[key].append((word["x0"], word["top"], word["text"]))
 
     result = []
     for row_key in row_keys:
@@ -98,6 +125,20 @@ FINANCIAL_CELL = re.compile(
     r"^[\s($]*\d[\d,.\s]*[)%]?$"
 )
 
+# Single-pass translate tables: one C traversal replaces the chains of
+# str.replace copies in normalize_number_string
+_DASH_WS_TRANS = str.maketrans({" ": None, "\u00a0": None, "−": "-", "–": "-"})
+_SEP_EN_TRANS = str.maketrans("", "", ",")
+_SEP_ES_TRANS = str.maketrans({".": None, ",": "."})
+_HAS_DIGIT = re.compile(r"\d").search
+_CLEAN_NUMBER = re.compile(r"^\d+\.?\d*$").match
+
+# One alternation covering all four separator-evidence shapes; lastindex
+# tells which alternative matched
+_FMT_EVIDENCE = re.compile(r"(\d,\d{3}\.)|(\d\.\d{3},)|(\d,\d{3}$)|(\d\.\d{3}$)")
+_PAREN_DASH_STRIP = re.compile(r"[()−–-]")
+_EN_FAST = re.compile(r"^-?\d{1,3}(?:,\d{3})*(?:\.\d+)?$").match
+
 
 def parse_page_range(spec):
     """Parse '5,6,7' or '5-10' or '5,8-12' into a sorted list of ints."""
@@ -115,7 +156,9 @@ def parse_page_range(spec):
 def detect_number_format(cells):
     """Determine whether numbers use English (1,234.56) or Spanish (1.234,56) format.
 
-    Scans all cells, counts evidence for each format, returns 'en' or 'es'.
+    Counts separator evidence per cell, returning 'en' or 'es'. Stops
+    early once 30+ cells have voted with a lopsided (5:1) majority —
+    large decks never need a full scan to settle the question.
     """
     en_evidence = 0
     es_evidence = 0
@@ -123,18 +166,33 @@ def detect_number_format(cells):
     for cell in cells:
         if cell is None:
             continue
-        cleaned = CURRENCY_PREFIX.sub("", str(cell)).strip()
-        cleaned = re.sub(r"[()−–-]", "", cleaned).strip()
+        s = str(cell)
+        # No separator, no evidence — skip the regex work entirely
+        if "," not in s and "." not in s:
+            continue
+        cleaned = CURRENCY_PREFIX.sub("", s).strip()
+        cleaned = _PAREN_DASH_STRIP.sub("", cleaned).strip()
 
-        if re.search(r"\d,\d{3}\.", cleaned):
+        m = _FMT_EVIDENCE.search(cleaned)
+        if m is None:
+            continue
+        g = m.lastindex
+        if g == 1:
             en_evidence += 1
-        elif re.search(r"\d\.\d{3},", cleaned):
+        elif g == 2:
             es_evidence += 1
-        elif re.search(r"\d,\d{3}$", cleaned) and "." not in cleaned:
-            en_evidence += 1
-        elif re.search(r"\d\.\d{3}$", cleaned) and "," not in cleaned:
+        elif g == 3:
+            if "." not in cleaned:
+                en_evidence += 1
+        elif "," not in cleaned:
             es_evidence += 1
 
+        total = en_evidence + es_evidence
+        if total >= 30:
+            hi = max(en_evidence, es_evidence)
+            if (total - hi) * 5 < hi:
+                break
+
     return "es" if es_evidence > en_evidence else "en"
 
 
@@ -150,7 +208,15 @@ def normalize_number_string(raw, fmt="en"):
         return None
 
     s = str(raw).strip()
-    if not s or not re.search(r"\d", s):
+    if not s:
+        return None
+
+    # Most cells are bare English numbers like "1,234.56" — handle them
+    # with one match and one replace, skipping the full cleanup pipeline
+    if fmt == "en" and _EN_FAST(s):
+        return s.replace(",", "")
+
+    if not _HAS_DIGIT(s):
         return None
 
     s = CURRENCY_PREFIX.sub("", s).strip()
@@ -161,23 +227,19 @@ def normalize_number_string(raw, fmt="en"):
         s = paren_match.group(1).strip()
         neg = True
 
-    s = s.replace("−", "-").replace("–", "-")
+    # Normalize unicode dashes and drop whitespace in one pass
+    s = s.translate(_DASH_WS_TRANS)
     if s.startswith("-"):
         neg = True
-        s = s[1:].strip()
-
-    s = s.replace(" ", "").replace("\u00a0", "")
+        s = s[1:]
 
-    if s == "-" or s == "—" or s == "–":
+    if s == "-" or s == "—":
         return "0"
 
-    if fmt == "es":
-        s = s.replace(".", "")
-        s = s.replace(",", ".")
-    else:
-        s = s.replace(",", "")
+    # Separator cleanup is a second single pass
+    s = s.translate(_SEP_ES_TRANS if fmt == "es" else _SEP_EN_TRANS)
 
-    if not re.match(r"^\d+\.?\d*$", s):
+    if not _CLEAN_NUMBER(s):
         return None
 
     if neg:
@@ -224,16 +286,20 @@ def detect_artifact_columns(table):
     max_cols = max(len(row) for row in table)
     strip_count = 0
 
+    # Counter scan per column, stopping at the first real column; avoids
+    # materializing a value list and a filtered copy for every column
     for col_idx in range(max_cols):
-        col_values = [row[col_idx] if col_idx < len(row) else None for row in table]
-        non_empty = [v for v in col_values if v is not None and str(v).strip()]
-
-        if not non_empty:
-            strip_count += 1
-            continue
+        non_empty = 0
+        artifacts = 0
+        for row in table:
+            v = row[col_idx] if col_idx < len(row) else None
+            if v is None or not str(v).strip():
+                continue
+            non_empty += 1
+            if is_rgb_artifact(v):
+                artifacts += 1
 
-        artifact_count = sum(1 for v in non_empty if is_rgb_artifact(v))
-        if artifact_count / len(non_empty) > 0.7:
+        if non_empty == 0 or artifacts / non_empty > 0.7:
             strip_count += 1
         else:
             break
@@ -260,25 +326,31 @@ def detect_continuation_columns(table):
         return set()
 
     max_cols = max(len(row) for row in table)
-    merge_cols = set()
-
-    for col_idx in range(1, max_cols):
-        col_values = [
-            str(row[col_idx]).strip() if col_idx < len(row) and row[col_idx] is not None else ""
-            for row in table
-        ]
-
-        non_empty = [v for v in col_values if v]
-        if not non_empty:
-            continue
-
-        financial_count = sum(1 for v in non_empty if is_financial_cell(v))
-        empty_ratio = 1 - len(non_empty) / len(col_values)
-
-        if financial_count == 0 and empty_ratio > 0.5:
-            merge_cols.add(col_idx)
+    n_rows = len(table)
 
-    return merge_cols
+    # One row-major pass accumulating per-column counters instead of
+    # rebuilding a stringified column list for every column
+    non_empty = [0] * max_cols
+    financial = [0] * max_cols
+    for row in table:
+        for col_idx in range(1, min(len(row), max_cols)):
+            v = row[col_idx]
+            if v is None:
+                continue
+            s = str(v).strip()
+            if not s:
+                continue
+            non_empty[col_idx] += 1
+            if is_financial_cell(s):
+                financial[col_idx] += 1
+
+    return {
+        col_idx
+        for col_idx in range(1, max_cols)
+        if non_empty[col_idx]
+        and financial[col_idx] == 0
+        and 1 - non_empty[col_idx] / n_rows > 0.5
+    }
 
 
 def merge_columns(table, merge_cols):
@@ -286,15 +358,29 @@ def merge_columns(table, merge_cols):
     if not merge_cols:
         return table
 
+    max_cols = max(len(row) for row in table)
+
+    # Resolve each merge column's destination once — the nearest column to
+    # its left that isn't itself being merged — instead of re-walking the
+    # merge set per cell per row
+    col_to_target = {}
+    tgt = 0
+    for i in range(max_cols):
+        if i in merge_cols:
+            col_to_target[i] = tgt
+        else:
+            tgt = i
+
+    merge_order = sorted(c for c in merge_cols if c >= 1)
+    kept_cols = [i for i in range(max_cols) if i not in merge_cols]
+
     merged_table = []
     for row in table:
         new_row = list(row)
-        for col_idx in sorted(merge_cols):
-            if col_idx >= len(new_row) or col_idx < 1:
+        for col_idx in merge_order:
+            if col_idx >= len(new_row):
                 continue
-            target = col_idx - 1
-            while target in merge_cols and target > 0:
-                target -= 1
+            target = col_to_target[col_idx]
 
             curr = str(new_row[target]).strip() if new_row[target] is not None else ""
             addition = str(new_row[col_idx]).strip() if new_row[col_idx] is not None else ""
@@ -308,11 +394,7 @@ def merge_columns(table, merge_cols):
                 new_row[target] = addition
             new_row[col_idx] = ""
 
-        final_row = [
-            new_row[i] for i in range(len(new_row))
-            if i not in merge_cols
-        ]
-        merged_table.append(final_row)
+        merged_table.append([new_row[i] for i in kept_cols if i < len(new_row)])
 
     return merged_table
 
@@ -378,7 +460,7 @@ TABLE_STRATEGIES = [
 ]
 
 
-def extract_tables_from_page(page):
+def extract_tables_from_page(page, words):
     """Try multiple strategies, return the one with the most data cells."""
     best_tables = []
     best_cell_count = 0
@@ -389,7 +471,7 @@ def extract_tables_from_page(page):
             cell_count = sum(
                 sum(1 for cell in row if cell is not None and str(cell).strip())
                 for table in tables
-                for row in extract_table_with_words(page, table)
+                for row in extract_table_with_words(table, words)
             )
             if cell_count > best_cell_count:
                 best_cell_count = cell_count
@@ -456,8 +538,8 @@ def process_table(raw_table, fmt):
     return data_rows, footnotes
 
 
-def detect_scale(all_text):
-    """Look for scale indicators in surrounding text."""
+def detect_scale(text_lower):
+    """Look for scale indicators in surrounding text (already lowercased)."""
     patterns = {
         "millones de pesos": "millions_mxn",
         "miles de pesos": "thousands_mxn",
@@ -468,16 +550,14 @@ def detect_scale(all_text):
         "in millions": "millions",
         "in thousands": "thousands",
     }
-    text_lower = all_text.lower()
     for pattern, scale in patterns.items():
         if pattern in text_lower:
             return scale
     return None
 
 
-def detect_currency(all_text):
-    """Detect currency from text context."""
-    text_lower = all_text.lower()
+def detect_currency(text_lower):
+    """Detect currency from text context (already lowercased)."""
     if "ps." in text_lower or "pesos" in text_lower or "mxn" in text_lower:
         return "MXN"
     if "usd" in text_lower or "us$" in text_lower or "dollars" in text_lower:
@@ -485,68 +565,108 @@ def detect_currency(all_text):
     return None
 
 
-def main():
-    if len(sys.argv) != 4:
-        print("Usage: python extract_tables.py <pdf_path> <output_dir> <page_numbers>", file=sys.stderr)
-        sys.exit(1)
+# Per-worker pdfplumber handle: each pool process opens the PDF once in
+# its initializer instead of once per page
+_WORKER_PDF = None
+
+
+def _open_worker_pdf(pdf_path):
+    import pdfplumber
+
+    global _WORKER_PDF
+    _WORKER_PDF = pdfplumber.open(pdf_path)
+
+
+def _extract_page(page):
+    """Extract all tables, format-detection cells, and text from one page.
+
+    The page text is captured here, while the page's char data is hot,
+    so scale/currency detection later doesn't re-parse every page.
+    """
+    words = page.extract_words(x_tolerance=2, y_tolerance=3, keep_blank_chars=True)
+
+    extracted = []
+    cells = []
+    for table, strategy in extract_tables_from_page(page, words):
+        raw = extract_table_with_words(table, words)
+        for row in clean_presentation_artifacts(raw):
+            cells.extend(c for c in row if c is not None)
+        extracted.append({"raw": raw, "strategy": strategy})
+    return extracted, cells, page.extract_text() or ""
+
 
-    pdf_path = sys.argv[1]
-    output_dir = Path(sys.argv[2])
-    page_spec = sys.argv[3]
+def _extract_page_worker(page_num):
+    extracted, cells, text = _extract_page(_WORKER_PDF.pages[page_num - 1])
+    return page_num, extracted, cells, text
+
+
+def extract(pdf_path, output_dir, pages, workers=1):
+    """Extract tables from the given pages into output_dir.
+
+    Writes one CSV per table plus _metadata.json and returns the metadata
+    dict. Pages are independent, so workers > 1 fans them out across a
+    process pool. Raises on missing/unopenable files; the CLI wrapper
+    reports those, while in-process callers (batch_extract) handle the
+    exception.
+    """
+    # Imported here rather than at module top: pdfplumber drags in
+    # pdfminer (~300ms), which usage errors shouldn't pay for
+    import pdfplumber
 
     path = Path(pdf_path)
     if not path.exists():
-        print(f"Error: File not found: {pdf_path}", file=sys.stderr)
-        sys.exit(1)
+        raise FileNotFoundError(f"File not found: {pdf_path}")
 
+    output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
-    pages = parse_page_range(page_spec)
 
-    try:
-        pdf = pdfplumber.open(str(path))
-    except Exception as e:
-        print(f"Error: Cannot open PDF: {e}", file=sys.stderr)
-        sys.exit(1)
+    pdf = pdfplumber.open(str(path))
 
     all_cells = []
     page_tables = {}
 
     print(f"Extracting tables from {len(pages)} pages...", file=sys.stderr)
 
+    valid_pages = []
     for page_num in pages:
         if page_num < 1 or page_num > len(pdf.pages):
             print(f"  Warning: Page {page_num} out of range (1-{len(pdf.pages)}), skipping", file=sys.stderr)
-            continue
+        else:
+            valid_pages.append(page_num)
 
-        page = pdf.pages[page_num - 1]
-        tables_with_strategy = extract_tables_from_page(page)
+    page_texts = {}
 
-        if not tables_with_strategy:
+    def collect(page_num, extracted, cells, text):
+        page_texts[page_num] = text
+        if not extracted:
             print(f"  Page {page_num}: no tables detected", file=sys.stderr)
-            continue
-
-        print(f"  Page {page_num}: {len(tables_with_strategy)} table(s)", file=sys.stderr)
-
-        extracted = []
-        for table, strategy in tables_with_strategy:
-            raw = extract_table_with_words(page, table)
-            cleaned_for_detection = clean_presentation_artifacts(raw)
-            for row in cleaned_for_detection:
-                all_cells.extend(c for c in row if c is not None)
-            extracted.append({"raw": raw, "strategy": strategy})
-
+            return
+        print(f"  Page {page_num}: {len(extracted)} table(s)", file=sys.stderr)
+        all_cells.extend(cells)
         page_tables[page_num] = extracted
 
+    if workers > 1 and len(valid_pages) > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_open_worker_pdf,
+            initargs=(str(path),),
+        ) as executor:
+            for result in executor.map(_extract_page_worker, valid_pages):
+                collect(*result)
+    else:
+        for page_num in valid_pages:
+            extracted, cells, text = _extract_page(pdf.pages[page_num - 1])
+            collect(page_num, extracted, cells, text)
+
     fmt = detect_number_format(all_cells)
     print(f"  Detected number format: {'Spanish (1.234,56)' if fmt == 'es' else 'English (1,234.56)'}", file=sys.stderr)
 
-    all_page_text = ""
-    for page_num in pages:
-        if page_num >= 1 and page_num <= len(pdf.pages):
-            all_page_text += (pdf.pages[page_num - 1].extract_text() or "") + "\n"
+    # Lowercase the combined text once; both detectors only do substring
+    # checks, so neither needs its own full-document copy
+    all_text_lower = "\n".join(page_texts.get(pn, "") for pn in valid_pages).lower()
 
-    scale = detect_scale(all_page_text)
-    currency = detect_currency(all_page_text)
+    scale = detect_scale(all_text_lower)
+    currency = detect_currency(all_text_lower)
 
     metadata = {
         "source_file": str(path.resolve()),
@@ -574,16 +694,22 @@ def main():
             filename = f"page_{page_num}_table_{table_idx + 1}.csv"
             csv_path = output_dir / filename
 
-            with open(csv_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-                for row in data_rows:
-                    cleaned = []
-                    for cell in row:
-                        if cell is None:
-                            cleaned.append("")
-                        else:
-                            cleaned.append(str(cell).strip())
-                    writer.writerow(cleaned)
+            # Clean rows up front and hand the whole batch to the C-level
+            # writerows loop, with a buffer big enough to flush once.
+            # Cells are almost always str already, so test that first and
+            # skip the redundant str() copy
+            cleaned_rows = [
+                [
+                    cell.strip() if isinstance(cell, str)
+                    else "" if cell is None
+                    else str(cell).strip()
+                    for cell in row
+                ]
+                for row in data_rows
+            ]
+            with open(csv_path, "w", newline="", encoding="utf-8",
+                      buffering=1 << 20) as f:
+                csv.writer(f, quoting=csv.QUOTE_ALL).writerows(cleaned_rows)
 
             csv_files.append(filename)
 
@@ -612,13 +738,34 @@ def main():
     pdf.close()
 
     metadata_path = output_dir / "_metadata.json"
-    with open(metadata_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    metadata_path.write_bytes(dumps_indented(metadata))
 
     print(f"\nDone. {len(csv_files)} CSV files written to {output_dir}", file=sys.stderr)
     print(f"Metadata: {metadata_path}", file=sys.stderr)
 
-    sys.stdout.buffer.write(json.dumps(metadata, indent=2, ensure_ascii=False).encode("utf-8"))
+    return metadata
+
+
+def main():
+    if len(sys.argv) not in (4, 5):
+        print("Usage: python extract_tables.py <pdf_path> <output_dir> <page_numbers> [workers]", file=sys.stderr)
+        sys.exit(1)
+
+    workers = int(sys.argv[4]) if len(sys.argv) == 5 else min(os.cpu_count() or 1, 4)
+
+    try:
+        extract(sys.argv[1], sys.argv[2], parse_page_range(sys.argv[3]),
+                workers=workers)
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: Cannot open PDF: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # extract() already serialized the metadata into _metadata.json;
+    # reuse those bytes for stdout instead of serializing the blob twice
+    sys.stdout.buffer.write((Path(sys.argv[2]) / "_metadata.json").read_bytes())
     sys.stdout.buffer.write(b"\n")
 
 
@@ -6,15 +6,23 @@ Designed to produce ~30KB for a 150-page document — small enough
 for Claude's context window to reason about which pages to target.
 
 Usage:
-    python scan_pdf.py <pdf_path>
+    python scan_pdf.py <pdf_path> [workers]
+
+    workers: parallel page-scanning processes (default: min(cpu_count, 4))
 """
 
 import json
+import os
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import pdfplumber
+try:
+    from _fastjson import dumps_indented
+except ImportError:
+    def dumps_indented(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
 
 FINANCIAL_KEYWORDS = {
     "en": [
@@ -40,8 +48,12 @@ FINANCIAL_KEYWORDS = {
     ],
 }
 
+# Every keyword is a literal lowercase phrase, so case-insensitive regex
+# search over lowered text is exactly `kw in text_lower` — and the C
+# substring search is far cheaper than 50 compiled-pattern calls per page
 ALL_KEYWORDS = FINANCIAL_KEYWORDS["en"] + FINANCIAL_KEYWORDS["es"]
-KEYWORD_PATTERNS = [re.compile(re.escape(kw), re.IGNORECASE) for kw in ALL_KEYWORDS]
+
+_HAS_NUM = re.compile(r"\d").search
 
 
 def scan_page(page):
@@ -49,27 +61,29 @@ def scan_page(page):
     text = page.extract_text() or ""
     text_lower = text.lower()
 
-    tables = page.find_tables(
-        table_settings={"vertical_strategy": "lines", "horizontal_strategy": "lines"}
-    )
-    tables_text = page.find_tables(
-        table_settings={"vertical_strategy": "text", "horizontal_strategy": "text"}
-    )
+    has_numbers = bool(_HAS_NUM(text))
 
-    table_count = max(len(tables), len(tables_text))
+    # Table detection is the expensive part of a scan, and the text/text
+    # strategy (word clustering) costs the most. A page without a single
+    # digit has no financial table worth counting, and when the ruled-line
+    # strategy already finds tables the clustering fallback adds nothing.
+    table_count = 0
+    if has_numbers:
+        table_count = len(page.find_tables(
+            table_settings={"vertical_strategy": "lines", "horizontal_strategy": "lines"}
+        ))
+        if table_count == 0:
+            table_count = len(page.find_tables(
+                table_settings={"vertical_strategy": "text", "horizontal_strategy": "text"}
+            ))
 
-    matched_keywords = []
-    for kw, pattern in zip(ALL_KEYWORDS, KEYWORD_PATTERNS):
-        if pattern.search(text_lower):
-            matched_keywords.append(kw)
+    matched_keywords = [kw for kw in ALL_KEYWORDS if kw in text_lower]
 
     preview_lines = [l.strip() for l in text.split("\n") if l.strip()][:5]
     preview = " | ".join(preview_lines)
     if len(preview) > 300:
         preview = preview[:300] + "..."
 
-    has_numbers = bool(re.search(r"[\d,]+\.?\d*", text))
-
     return {
         "page": page.page_number,
         "tables": table_count,
@@ -80,41 +94,71 @@ def scan_page(page):
     }
 
 
-def scan_pdf(pdf_path):
-    """Scan all pages and return structured metadata."""
+# Per-worker pdfplumber handle: each pool process opens the PDF once in
+# its initializer instead of once per page
+_WORKER_PDF = None
+
+
+def _open_worker_pdf(pdf_path):
+    import pdfplumber
+
+    global _WORKER_PDF
+    _WORKER_PDF = pdfplumber.open(pdf_path)
+
+
+def _scan_page_by_index(index):
+    return scan_page(_WORKER_PDF.pages[index])
+
+
+def scan_pdf(pdf_path, workers=1):
+    """Scan all pages and return structured metadata.
+
+    Pages are independent, so workers > 1 fans them out across a process
+    pool. Raises on missing/unopenable files; the CLI wrapper turns those
+    into JSON error output, while in-process callers (batch_extract)
+    handle the exception directly.
+    """
+    # Imported here rather than at module top: pdfplumber drags in
+    # pdfminer (~300ms), which usage errors shouldn't pay for
+    import pdfplumber
+
     path = Path(pdf_path)
     if not path.exists():
-        print(json.dumps({"error": f"File not found: {pdf_path}"}))
-        sys.exit(1)
+        raise FileNotFoundError(f"File not found: {pdf_path}")
 
-    try:
-        pdf = pdfplumber.open(str(path))
-    except Exception as e:
-        if "password" in str(e).lower() or "encrypted" in str(e).lower():
-            print(json.dumps({"error": "PDF is password-protected. Provide the password or use an unlocked copy."}))
-        else:
-            print(json.dumps({"error": f"Cannot open PDF: {e}"}))
-        sys.exit(1)
+    pdf = pdfplumber.open(str(path))
 
     total_pages = len(pdf.pages)
     print(f"Scanning {total_pages} pages...", file=sys.stderr)
 
     pages = []
-    financial_pages = []
-
-    for i, page in enumerate(pdf.pages):
-        if (i + 1) % 10 == 0 or i == 0:
-            print(f"  Page {i + 1}/{total_pages}", file=sys.stderr)
-
-        info = scan_page(page)
-        pages.append(info)
 
-        if info["tables"] > 0 or info["financial_keywords"]:
-            financial_pages.append(info["page"])
+    if workers > 1 and total_pages > 1:
+        pdf.close()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_open_worker_pdf,
+            initargs=(str(path),),
+        ) as executor:
+            for i, info in enumerate(
+                executor.map(_scan_page_by_index, range(total_pages), chunksize=4)
+            ):
+                if (i + 1) % 10 == 0 or i == 0:
+                    print(f"  Page {i + 1}/{total_pages}", file=sys.stderr)
+                pages.append(info)
+    else:
+        for i, page in enumerate(pdf.pages):
+            if (i + 1) % 10 == 0 or i == 0:
+                print(f"  Page {i + 1}/{total_pages}", file=sys.stderr)
+            pages.append(scan_page(page))
+        pdf.close()
+
+    financial_pages = [
+        info["page"] for info in pages
+        if info["tables"] > 0 or info["financial_keywords"]
+    ]
 
-    pdf.close()
-
-    result = {
+    return {
         "file": str(path.resolve()),
         "total_pages": total_pages,
         "financial_pages": financial_pages,
@@ -122,11 +166,28 @@ def scan_pdf(pdf_path):
         "pages": pages,
     }
 
-    print(json.dumps(result, indent=2))
 
+def main():
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python scan_pdf.py <pdf_path> [workers]", file=sys.stderr)
+        sys.exit(1)
 
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python scan_pdf.py <pdf_path>", file=sys.stderr)
+    workers = int(sys.argv[2]) if len(sys.argv) == 3 else min(os.cpu_count() or 1, 4)
+
+    try:
+        result = scan_pdf(sys.argv[1], workers=workers)
+    except FileNotFoundError as e:
+        print(json.dumps({"error": str(e)}))
         sys.exit(1)
-    scan_pdf(sys.argv[1])
+    except Exception as e:
+        if "password" in str(e).lower() or "encrypted" in str(e).lower():
+            print(json.dumps({"error": "PDF is password-protected. Provide the password or use an unlocked copy."}))
+        else:
+            print(json.dumps({"error": f"Cannot open PDF: {e}"}))
+        sys.exit(1)
+
+    sys.stdout.buffer.write(dumps_indented(result) + b"\n")
+
+
+if __name__ == "__main__":
+    main()